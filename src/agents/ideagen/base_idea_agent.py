@@ -13,10 +13,10 @@ _project_root = Path(__file__).parent.parent.parent.parent
 if str(_project_root) not in sys.path:
     sys.path.insert(0, str(_project_root))
 
-from lightrag.llm.openai import openai_complete_if_cache
-
 from src.core.core import get_agent_params, get_llm_config, load_config_with_main
-from src.core.logging import LLMStats, get_logger
+from src.core.llm_cache import LLM_CACHE_ENABLED, llm_cache_get, llm_cache_key, llm_cache_put
+from src.core.llm_limits import get_openai_complete, llm_semaphore
+from src.core.logging import LLMStats, Logger, get_logger
 
 
 class BaseIdeaAgent(ABC):
@@ -25,6 +25,9 @@ class BaseIdeaAgent(ABC):
     # Shared stats tracker for all ideagen agents
     _shared_stats: LLMStats | None = None
 
+    # Shared logger for all ideagen agents
+    _shared_logger: Logger | None = None
+
     def __init__(
         self,
         api_key: str | None = None,
@@ -51,18 +54,25 @@ class BaseIdeaAgent(ABC):
         except ValueError as e:
             raise ValueError(f"LLM config error: {e!s}")
 
-        # Initialize logger (from config)
-        try:
-            config = load_config_with_main(
-                "solve_config.yaml", _project_root
-            )  # Use any config to get main.yaml
-            log_dir = config.get("paths", {}).get("user_log_dir") or config.get("logging", {}).get(
-                "log_dir"
-            )
-            self.logger = get_logger("IdeaGen", log_dir=log_dir)
-        except Exception:
-            # Fallback logger
-            self.logger = get_logger("IdeaGen")
+        # Initialize logger (shared by all ideagen agents)
+        self.logger = self._get_shared_logger()
+
+    @classmethod
+    def _get_shared_logger(cls) -> Logger:
+        """Get or create the IdeaGen logger, loading its log dir from config only once."""
+        if BaseIdeaAgent._shared_logger is None:
+            try:
+                config = load_config_with_main(
+                    "solve_config.yaml", _project_root
+                )  # Use any config to get main.yaml
+                log_dir = config.get("paths", {}).get("user_log_dir") or config.get(
+                    "logging", {}
+                ).get("log_dir")
+                BaseIdeaAgent._shared_logger = get_logger("IdeaGen", log_dir=log_dir)
+            except Exception:
+                # Fallback logger
+                BaseIdeaAgent._shared_logger = get_logger("IdeaGen")
+        return BaseIdeaAgent._shared_logger
 
     @classmethod
     def get_stats(cls) -> LLMStats:
@@ -123,7 +133,27 @@ class BaseIdeaAgent(ABC):
         if response_format:
             kwargs["response_format"] = response_format
 
-        response = await openai_complete_if_cache(**kwargs)
+        cache_key = None
+        if LLM_CACHE_ENABLED:
+            cache_key = llm_cache_key(
+                self.model,
+                self.base_url,
+                system_prompt,
+                user_prompt,
+                temperature,
+                max_tokens,
+                response_format,
+            )
+            cached = llm_cache_get(cache_key)
+            if cached is not None:
+                self.get_stats().add_call(model=self.model, prompt_tokens=0, completion_tokens=0)
+                return cached
+
+        async with llm_semaphore():
+            response = await get_openai_complete()(**kwargs)
+
+        if cache_key is not None:
+            llm_cache_put(cache_key, response)
 
         # Track token usage
         stats = self.get_stats()
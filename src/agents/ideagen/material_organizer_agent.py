@@ -3,28 +3,45 @@ Material Organizer Agent
 Extracts knowledge points from notebook records
 """
 
-import json
+import asyncio
+import functools
 from pathlib import Path
 from typing import Any
 
-import yaml
+from src.core.fast_json import loads as _loads
+from src.core.llm_limits import llm_call_errors
 
 from .base_idea_agent import BaseIdeaAgent
 
+_PROMPTS_DIR = Path(__file__).parent / "prompts"
+
+# Minimum description length for an extracted knowledge point to be kept
+MIN_DESC_LEN = 10
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_prompt_file(prompt_file: Path, mtime_ns: int) -> dict:
+    """Parse a prompt YAML file (mtime_ns is part of the cache key so edits invalidate it)"""
+    import yaml
+
+    try:
+        from yaml import CSafeLoader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeLoader as CSafeLoader
+
+    with open(prompt_file, encoding="utf-8") as f:
+        return yaml.load(f, Loader=CSafeLoader)
+
 
 def _load_prompts(language: str = "en") -> dict:
     """Load prompts from YAML file based on language"""
-    prompts_dir = Path(__file__).parent / "prompts" / language
-    prompt_file = prompts_dir / "material_organizer.yaml"
-    if prompt_file.exists():
-        with open(prompt_file, encoding="utf-8") as f:
-            return yaml.safe_load(f)
-    # Fallback to English if language file not found
-    fallback_file = Path(__file__).parent / "prompts" / "en" / "material_organizer.yaml"
-    if fallback_file.exists():
-        with open(fallback_file, encoding="utf-8") as f:
-            return yaml.safe_load(f)
-    return {}
+    prompt_file = _PROMPTS_DIR / language / "material_organizer.yaml"
+    if not prompt_file.exists():
+        # Fallback to English if language file not found
+        prompt_file = _PROMPTS_DIR / "en" / "material_organizer.yaml"
+        if not prompt_file.exists():
+            return {}
+    return _parse_prompt_file(prompt_file, prompt_file.stat().st_mtime_ns)
 
 
 class MaterialOrganizerAgent(BaseIdeaAgent):
@@ -36,7 +53,10 @@ class MaterialOrganizerAgent(BaseIdeaAgent):
         self._prompts = _load_prompts(language)
 
     async def process(
-        self, records: list[dict[str, Any]], user_thoughts: str | None = None
+        self,
+        records: list[dict[str, Any]],
+        user_thoughts: str | None = None,
+        batch_size: int = 8,
     ) -> list[dict[str, Any]]:
         """
         Organize materials and extract knowledge points
@@ -44,35 +64,71 @@ class MaterialOrganizerAgent(BaseIdeaAgent):
         Args:
             records: Notebook record list
             user_thoughts: Optional user thoughts
+            batch_size: Maximum records per LLM request; larger inputs are split
+                into batches that are extracted concurrently (values below 1 count as 1)
 
         Returns:
             Knowledge point list, each containing:
             - knowledge_point: Knowledge point name
             - description: Description of this knowledge point from system response
         """
-        materials = []
-        for record in records:
-            materials.append(
-                {
-                    "type": record.get("type", ""),
-                    "title": record.get("title", ""),
-                    "user_query": record.get("user_query", ""),
-                    "output": record.get("output", ""),
-                }
-            )
-
-        materials_text = ""
-        for i, mat in enumerate(materials, 1):
-            materials_text += f"\n\n=== Record {i} ===\n"
-            materials_text += f"Type: {mat['type']}\n"
-            materials_text += f"Title: {mat['title']}\n"
-            materials_text += f"User Query: {mat['user_query']}\n"
-            materials_text += f"System Response: {mat['output']}\n"
-
         user_thoughts_text = ""
         if user_thoughts and user_thoughts.strip():
             user_thoughts_text = f"\n\nUser Additional Thoughts:\n{user_thoughts}"
 
+        batch_size = max(1, batch_size)
+        batches = [records[i : i + batch_size] for i in range(0, len(records), batch_size)]
+        if not batches:
+            batches = [records]
+
+        self.logger.info(f"Processing {len(records)} records in {len(batches)} batch(es)...")
+
+        batch_results = await asyncio.gather(
+            *(
+                self._extract_batch(batch, i * batch_size, user_thoughts_text)
+                for i, batch in enumerate(batches)
+            ),
+            return_exceptions=True,
+        )
+
+        # Merge batches, dropping knowledge points extracted more than once
+        validated_points = []
+        seen = set()
+        for i, points in enumerate(batch_results, 1):
+            if isinstance(points, BaseException):
+                if not isinstance(points, Exception):
+                    raise points  # Cancellation and other non-errors still propagate
+                # Keep the other batches' results when one batch fails
+                self.logger.error(f"Batch {i}/{len(batches)} extraction failed: {points}")
+                continue
+            for point in points:
+                name = point["knowledge_point"].lower()
+                if name not in seen:
+                    seen.add(name)
+                    validated_points.append(point)
+
+        if not validated_points and records:
+            return await self._fallback_extract(records, user_thoughts)
+
+        self.logger.info(f"Validated {len(validated_points)} knowledge points")
+        return validated_points
+
+    async def _extract_batch(
+        self, records: list[dict[str, Any]], offset: int, user_thoughts_text: str
+    ) -> list[dict[str, Any]]:
+        """Extract and validate knowledge points from one batch of records"""
+        parts: list[str] = []
+        for i, record in enumerate(records, offset + 1):
+            get = record.get
+            parts.append(
+                f"\n\n=== Record {i} ===\n"
+                f"Type: {get('type', '')}\n"
+                f"Title: {get('title', '')}\n"
+                f"User Query: {get('user_query', '')}\n"
+                f"System Response: {get('output', '')}\n"
+            )
+        materials_text = "".join(parts)
+
         system_prompt = self._prompts.get("system", "")
         user_template = self._prompts.get("user_template", "")
         user_prompt = user_template.format(
@@ -80,8 +136,6 @@ class MaterialOrganizerAgent(BaseIdeaAgent):
             user_thoughts_text=user_thoughts_text,
         )
 
-        self.logger.info(f"Processing {len(records)} records...")
-
         response = await self.call_llm(
             user_prompt=user_prompt,
             system_prompt=system_prompt,
@@ -91,37 +145,31 @@ class MaterialOrganizerAgent(BaseIdeaAgent):
         self.logger.debug(f"LLM response length: {len(response)} chars")
 
         try:
-            result = json.loads(response)
-            knowledge_points = result.get("knowledge_points", [])
-            self.logger.info(f"Extracted {len(knowledge_points)} knowledge points")
-
-            validated_points = []
-            for point in knowledge_points:
-                if "knowledge_point" in point and "description" in point:
-                    kp = str(point["knowledge_point"]).strip()
-                    desc = str(point["description"]).strip()
-                    if kp and desc and len(desc) >= 10:
-                        validated_points.append({"knowledge_point": kp, "description": desc})
-
-            if not validated_points and records:
-                return await self._fallback_extract(records, user_thoughts)
-
-            self.logger.info(f"Validated {len(validated_points)} knowledge points")
-            return validated_points
-        except json.JSONDecodeError as e:
+            result = _loads(response)
+        except ValueError as e:
             self.logger.error(f"JSON decode error: {e}")
             self.logger.debug(f"Raw response: {response[:500]}...")
-            return await self._fallback_extract(records, user_thoughts)
+            return []
+
+        knowledge_points = result.get("knowledge_points", [])
+        self.logger.info(f"Extracted {len(knowledge_points)} knowledge points")
+
+        return [
+            {"knowledge_point": kp, "description": desc}
+            for p in knowledge_points
+            if isinstance(p, dict)
+            and (kp := str(p.get("knowledge_point", "")).strip())
+            and len(desc := str(p.get("description", "")).strip()) >= MIN_DESC_LEN
+        ]
 
     async def _fallback_extract(
         self, records: list[dict[str, Any]], user_thoughts: str | None = None
     ) -> list[dict[str, Any]]:
         """Fallback extraction method using more lenient strategy"""
-        materials_text = ""
-        for i, record in enumerate(records, 1):
-            materials_text += (
-                f"\nRecord {i}: {record.get('title', '')} - {record.get('user_query', '')[:100]}"
-            )
+        materials_text = "".join(
+            f"\nRecord {i}: {record.get('title', '')} - {record.get('user_query', '')[:100]}"
+            for i, record in enumerate(records, 1)
+        )
 
         system_prompt = self._prompts.get("fallback_system", "")
         user_template = self._prompts.get("fallback_user_template", "")
@@ -137,16 +185,16 @@ class MaterialOrganizerAgent(BaseIdeaAgent):
                 system_prompt=system_prompt,
                 response_format={"type": "json_object"},
             )
-            result = json.loads(response)
+            result = _loads(response)
             knowledge_points = result.get("knowledge_points", [])
 
-            validated_points = []
-            for point in knowledge_points:
-                if "knowledge_point" in point and "description" in point:
-                    kp = str(point["knowledge_point"]).strip()
-                    desc = str(point["description"]).strip()
-                    if kp and desc:
-                        validated_points.append({"knowledge_point": kp, "description": desc})
+            validated_points = [
+                {"knowledge_point": kp, "description": desc}
+                for p in knowledge_points
+                if isinstance(p, dict)
+                and (kp := str(p.get("knowledge_point", "")).strip())
+                and (desc := str(p.get("description", "")).strip())
+            ]
 
             return (
                 validated_points
@@ -158,7 +206,9 @@ class MaterialOrganizerAgent(BaseIdeaAgent):
                     }
                 ]
             )
-        except Exception:
+        except (ValueError, KeyError, TypeError, AttributeError, *llm_call_errors()):
+            # Decode errors, malformed payloads and transport/API failures; cancellation propagates
+            self.logger.exception("Fallback extraction failed, using generic knowledge point")
             return [
                 {
                     "knowledge_point": "Comprehensive Research Topic",
@@ -4,27 +4,82 @@ BaseAgent - Base class for all Agents, providing unified initialization, configu
 """
 
 from abc import ABC, abstractmethod
+import asyncio
 import os
 from pathlib import Path
 import sys
 from typing import Any
 
-from lightrag.llm.openai import openai_complete_if_cache
-
 from .utils import PromptLoader
-from .utils.token_tracker import TokenTracker
+from .utils.token_tracker import TIKTOKEN_AVAILABLE, TokenTracker, get_tiktoken_encoding
 
 # Add project root to path for logs import
 _project_root = Path(__file__).parent.parent.parent.parent
 if str(_project_root) not in sys.path:
     sys.path.insert(0, str(_project_root))
 from src.core.core import get_agent_params
+from src.core.llm_cache import LLM_CACHE_ENABLED, llm_cache_get, llm_cache_key, llm_cache_put
+from src.core.llm_limits import get_openai_complete, llm_semaphore
 from src.core.logging import get_logger
 
+# Model name -> tiktoken encoding, or None when tiktoken is unusable for it
+_encodings: dict[str, Any] = {}
+
+
+def _resolve_encoding(model: str) -> Any:
+    """Load the tiktoken encoding for a model (may download the BPE file), None on failure"""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        return get_tiktoken_encoding(model)
+    except Exception:
+        # e.g. the encoding file cannot be downloaded offline
+        return None
+
+
+async def _get_encoding(model: str) -> Any:
+    """Cached encoding for a model, resolved once in a worker thread to keep the event loop free"""
+    if model not in _encodings:
+        _encodings[model] = await asyncio.to_thread(_resolve_encoding, model)
+    return _encodings[model]
+
+
+def _estimate_tokens(text: str, encoding: Any) -> int:
+    """Estimate token count with the tiktoken encoding if given, else ~4 characters per token"""
+    if encoding is not None:
+        try:
+            return len(encoding.encode(text))
+        except Exception:
+            pass
+    return len(text) // 4
+
+
+class TokenTrackerWrapper:
+    """Adapter passed to lightrag as token_tracker, forwarding API usage to a TokenTracker"""
+
+    def __init__(self, tracker: TokenTracker, agent_name: str, stage: str, model: str):
+        self.tracker = tracker
+        self.agent_name = agent_name
+        self.stage = stage
+        self.model = model
+        self.usage = None
+
+    def add_usage(self, token_counts):
+        self.usage = token_counts
+        self.tracker.add_usage(
+            agent_name=self.agent_name,
+            stage=self.stage,
+            model=self.model,
+            token_counts=token_counts,
+        )
+
 
 class BaseAgent(ABC):
     """Base class for Agents, providing unified configuration and LLM calling interface"""
 
+    # One PromptLoader per (prompts_dir, lang_code), so its file-keyed cache is shared by all agents
+    _prompt_loaders: dict[tuple[str, str], PromptLoader] = {}
+
     def __init__(
         self,
         config: dict[str, Any],
@@ -43,12 +98,28 @@ class BaseAgent(ABC):
             base_url: API endpoint
             agent_name: Agent name, used to read dedicated configuration from config
             use_prompt_loader: Whether to use PromptLoader to load Prompts (default True, for backward compatibility)
+
+        Raises:
+            ValueError: If environment variable LLM_MODEL is not set
         """
         self.config = config
         self.api_key = api_key
         self.base_url = base_url
         self.agent_name = agent_name
 
+        # Model must come from environment variable LLM_MODEL (fail fast if missing)
+        self._env_model = os.getenv("LLM_MODEL")
+        if not self._env_model:
+            raise ValueError(
+                f"Error: Environment variable LLM_MODEL is not set\n"
+                f"Please configure LLM_MODEL in your .env file, for example:\n"
+                f"LLM_MODEL=gpt-4o-mini\n"
+                f"Agent: {agent_name}"
+            )
+
+        # Per-instance kwargs shared by every LLM call
+        self._llm_base_kwargs = {"api_key": api_key, "base_url": base_url}
+
         # Initialize logger, used uniformly by all subclasses
         self.logger = get_logger(name=agent_name)
 
@@ -66,6 +137,11 @@ class BaseAgent(ABC):
 
         # Token tracker
         self.token_tracker = token_tracker
+        # Advanced trackers accept system_prompt/user_prompt/response_text (tiktoken or litellm)
+        self._tracker_is_advanced = (
+            token_tracker is not None
+            and "response_text" in token_tracker.add_usage.__code__.co_varnames
+        )
 
         # Prompt management
         self.use_prompt_loader = use_prompt_loader
@@ -79,11 +155,9 @@ class BaseAgent(ABC):
             language = config.get("system", {}).get("language", "zh")
             lang_code = parse_language(language)
 
-            # Prompts are in src/agents/solve/prompts/
-            prompts_dir = Path(__file__).parent / "prompts"
-            self.prompt_loader = PromptLoader(base_dir=prompts_dir, language=lang_code)
+            self.prompt_loader = self._get_prompt_loader(lang_code)
 
-            # Try to load Prompts for this Agent
+            # Try to load Prompts for this Agent (cached until the YAML file changes)
             try:
                 self.prompts = self.prompt_loader.load(agent_name)
                 # Successfully loaded, log it
@@ -105,31 +179,48 @@ class BaseAgent(ABC):
                 else:
                     print(f"Error: {error_msg}")
 
+    @staticmethod
+    def _get_prompt_loader(lang_code: str) -> PromptLoader:
+        """Return the shared PromptLoader for a language"""
+        # Prompts are in src/agents/solve/prompts/
+        prompts_dir = Path(__file__).parent / "prompts"
+        key = (str(prompts_dir), lang_code)
+        loader = BaseAgent._prompt_loaders.get(key)
+        if loader is None:
+            loader = BaseAgent._prompt_loaders.setdefault(
+                key, PromptLoader(base_dir=prompts_dir, language=lang_code)
+            )
+        return loader
+
+    @classmethod
+    def prefetch_prompts(cls, language: str) -> int:
+        """
+        Load every solve prompt for a language into the shared PromptLoader
+
+        Args:
+            language: Language setting (parsed with parse_language)
+
+        Returns:
+            Number of prompt files loaded
+        """
+        from src.core.core import parse_language
+
+        lang_code = parse_language(language)
+        return len(cls._get_prompt_loader(lang_code).prefetch_all())
+
     def get_model(self, key: str = "model") -> str:
         """
         Get model name
 
-        Must be read from environment variable LLM_MODEL, raise error if not configured
+        Read from environment variable LLM_MODEL, resolved once when the Agent is created
 
         Args:
             key: Configuration key name (deprecated, kept for backward compatibility)
 
         Returns:
             Model name
-
-        Raises:
-            ValueError: If environment variable LLM_MODEL is not set
         """
-        # Must read from environment variable
-        env_model = os.getenv("LLM_MODEL")
-        if not env_model:
-            raise ValueError(
-                f"Error: Environment variable LLM_MODEL is not set\n"
-                f"Please configure LLM_MODEL in your .env file, for example:\n"
-                f"LLM_MODEL=gpt-4o-mini\n"
-                f"Agent: {self.agent_name}"
-            )
-        return env_model
+        return self._env_model
 
     def get_temperature(self) -> float:
         """
@@ -187,11 +278,10 @@ class BaseAgent(ABC):
         max_tokens = self.get_max_tokens()
 
         kwargs = {
+            **self._llm_base_kwargs,
             "model": model,
             "prompt": user_prompt,
             "system_prompt": system_prompt,
-            "api_key": self.api_key,
-            "base_url": self.base_url,
             "temperature": temperature,
         }
 
@@ -211,40 +301,54 @@ class BaseAgent(ABC):
                 metadata={"model": model, "temperature": temperature, "max_tokens": max_tokens},
             )
 
-        # Create TokenTracker wrapper (if token_tracker is provided)
-        token_tracker_wrapper = None
-        if self.token_tracker:
-
-            class TokenTrackerWrapper:
-                def __init__(self, tracker, agent_name, stage):
-                    self.tracker = tracker
-                    self.agent_name = agent_name
-                    self.stage = stage
-                    self.usage = None
-
-                def add_usage(self, token_counts):
-                    self.usage = token_counts
-                    self.tracker.add_usage(
+        cache_key = None
+        if LLM_CACHE_ENABLED:
+            cache_key = llm_cache_key(
+                model,
+                self.base_url,
+                system_prompt,
+                user_prompt,
+                temperature,
+                max_tokens,
+                response_format,
+            )
+            cached = llm_cache_get(cache_key)
+            if cached is not None:
+                if self.token_tracker:
+                    self.token_tracker.add_usage(
                         agent_name=self.agent_name,
-                        stage=self.stage,
+                        stage=stage_label,
                         model=model,
-                        token_counts=token_counts,
+                        prompt_tokens=0,
+                        completion_tokens=0,
+                    )
+                if hasattr(self.logger, "log_llm_output"):
+                    self.logger.log_llm_output(
+                        agent_name=self.agent_name,
+                        stage=stage_label,
+                        response=cached,
+                        metadata={"length": len(cached), "cached": True},
                     )
+                return cached
 
+        # Create TokenTracker wrapper (if token_tracker is provided)
+        token_tracker_wrapper = None
+        if self.token_tracker:
             token_tracker_wrapper = TokenTrackerWrapper(
-                self.token_tracker, self.agent_name, stage_label
+                self.token_tracker, self.agent_name, stage_label, model
             )
             kwargs["token_tracker"] = token_tracker_wrapper
 
-        response = await openai_complete_if_cache(**kwargs)
+        async with llm_semaphore():
+            response = await get_openai_complete()(**kwargs)
+
+        if cache_key is not None:
+            llm_cache_put(cache_key, response)
 
         # If token_tracker exists but didn't get usage info from API, try using more precise method
         if self.token_tracker and token_tracker_wrapper and not token_tracker_wrapper.usage:
             # Check if advanced tracking is supported (using tiktoken or litellm)
-            if (
-                hasattr(self.token_tracker, "add_usage")
-                and len(self.token_tracker.add_usage.__code__.co_varnames) > 6
-            ):
+            if self._tracker_is_advanced:
                 # Advanced tracker: supports system_prompt, user_prompt, response_text parameters
                 self.token_tracker.add_usage(
                     agent_name=self.agent_name,
@@ -256,14 +360,14 @@ class BaseAgent(ABC):
                 )
             else:
                 # Basic tracker: use estimation method
-                estimated_prompt_tokens = len(system_prompt.split()) + len(user_prompt.split())
-                estimated_completion_tokens = len(response.split())
+                encoding = await _get_encoding(model)
                 self.token_tracker.add_usage(
                     agent_name=self.agent_name,
                     stage=stage_label,
                     model=model,
-                    prompt_tokens=int(estimated_prompt_tokens * 1.3),
-                    completion_tokens=int(estimated_completion_tokens * 1.3),
+                    prompt_tokens=_estimate_tokens(system_prompt, encoding)
+                    + _estimate_tokens(user_prompt, encoding),
+                    completion_tokens=_estimate_tokens(response, encoding),
                 )
 
         if hasattr(self.logger, "log_llm_output"):
@@ -10,6 +10,12 @@ import json
 import re
 from typing import Any
 
+from src.core.fast_json import loads as _loads
+
+_TRIPLE_QUOTED_RE = re.compile(r'"""([\s\S]*?)"""')
+_CODE_BLOCK_RE = re.compile(r"```(?:json)?\s*([\s\S]*?)\s*```")
+_CTRL_CHARS_RE = re.compile(r"[\x00-\x1f\x7f-\x9f]")
+
 
 def _escape_triple_quoted_strings(text: str) -> str:
     """
@@ -25,8 +31,43 @@ def _escape_triple_quoted_strings(text: str) -> str:
         # json.dumps safely escapes newlines and quotes
         return json.dumps(content)
 
-    pattern = re.compile(r'"""([\s\S]*?)"""')
-    return pattern.sub(replacer, text)
+    return _TRIPLE_QUOTED_RE.sub(replacer, text)
+
+
+def _find_balanced(text: str, open_ch: str, close_ch: str) -> str | None:
+    """
+    Return the first balanced open_ch ... close_ch region of text.
+
+    Walks the text once, ignoring brackets inside JSON string literals
+    (including escaped quotes), so trailing prose containing braces
+    does not widen the match.
+    """
+    start = text.find(open_ch)
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == open_ch:
+            depth += 1
+        elif ch == close_ch:
+            depth -= 1
+            if depth == 0:
+                return text[start : i + 1]
+
+    return None
 
 
 def extract_json_from_text(text: str) -> dict[str, Any] | list[Any] | None:
@@ -49,43 +90,52 @@ def extract_json_from_text(text: str) -> dict[str, Any] | list[Any] | None:
     if not text:
         return None
 
+    # 0. Fast path: replies requested with response_format=json_object are usually pure JSON
+    stripped = text.lstrip()
+    tried_direct = stripped[:1] in ("{", "[")
+    if tried_direct:
+        try:
+            return _loads(stripped)
+        except ValueError:
+            pass
+
     # 🔧 FIX: sanitize triple-quoted strings before any JSON parsing
-    text = _escape_triple_quoted_strings(text)
+    sanitized = _escape_triple_quoted_strings(text)
+    if sanitized != text:
+        tried_direct = False
+    text = sanitized
 
     # 1. Try matching Markdown code blocks
-    code_block_pattern = re.compile(r"```(?:json)?\s*([\s\S]*?)\s*```")
-    match = code_block_pattern.search(text)
+    match = _CODE_BLOCK_RE.search(text)
 
     if match:
         json_str = match.group(1).strip()
         try:
-            return json.loads(json_str)
-        except json.JSONDecodeError:
+            return _loads(json_str)
+        except ValueError:
             pass
 
-    # 2. Try parsing the full text directly
-    try:
-        return json.loads(text)
-    except json.JSONDecodeError:
-        pass
-
-    # 3. Try extracting outermost JSON object
-    json_obj_pattern = re.compile(r"\{[\s\S]*\}")
-    match_obj = json_obj_pattern.search(text)
-    if match_obj:
+    # 2. Try parsing the full text directly (unless the fast path already saw this text)
+    if not tried_direct:
         try:
-            return json.loads(match_obj.group(0))
-        except json.JSONDecodeError:
+            return _loads(text)
+        except ValueError:
             pass
 
-    # 4. Try extracting outermost JSON array
-    json_arr_pattern = re.compile(r"\[[\s\S]*\]")
-    match_arr = json_arr_pattern.search(text)
-    if match_arr:
-        try:
-            return json.loads(match_arr.group(0))
-        except json.JSONDecodeError:
-            pass
+    # 3. Scan for the first balanced JSON object or array (whichever starts first)
+    obj_start = text.find("{")
+    arr_start = text.find("[")
+    brackets = [("{", "}"), ("[", "]")]
+    if arr_start != -1 and (obj_start == -1 or arr_start < obj_start):
+        brackets.reverse()
+
+    for open_ch, close_ch in brackets:
+        fragment = _find_balanced(text, open_ch, close_ch)
+        if fragment:
+            try:
+                return _loads(fragment)
+            except ValueError:
+                pass
 
     return None
 
@@ -94,4 +144,4 @@ def clean_json_string(json_str: str) -> str:
     """
     Clean JSON string by removing illegal control characters.
     """
-    return re.sub(r"[\x00-\x1f\x7f-\x9f]", "", json_str)
+    return _CTRL_CHARS_RE.sub("", json_str)
@@ -4,11 +4,36 @@ Prompt Loader - Unified Prompt loading and management system
 Supports multi-language, version control, and caching
 """
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import hashlib
+import os
 from pathlib import Path
+import pickle
+import sys
+import tempfile
 from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as CSafeLoader
+
+# Persistent cache of built prompts, shared across process restarts
+_SIDECAR_DIR = Path(tempfile.gettempdir()) / "deeptutor_prompts"
+# Bump when _build_prompts output or the pickle layout changes so stale pickles are not reused
+_SIDECAR_VERSION = 2
+
+# Optional sections of a structured system prompt, in output order: (key, heading, is_list)
+_STRUCTURED_SECTIONS = (
+    ("requirements", "Requirements", True),
+    ("constraints", "Constraints", True),
+    ("output_format", "Output Format", False),
+    ("notes", "Notes", True),
+)
+
 
 class PromptLoader:
     """Prompt loader - Load Prompt configuration from YAML files"""
@@ -28,7 +53,13 @@ class PromptLoader:
 
         self.base_dir = base_dir
         self.language = language
-        self._cache = {}
+        # Bounded LRU of built prompts, keyed by (path, st_mtime_ns, st_size) so edits invalidate
+        self._cache: OrderedDict[tuple[str, int, int], dict[str, str]] = OrderedDict()
+        self._cache_max = 128
+        # (agent_name, version, language) -> file key of the last load
+        self._name_to_key: dict[tuple[str, str, str], tuple[str, int, int]] = {}
+        # language -> {agent_name: prompt file}, scanned once per language on first miss
+        self._index: dict[str, dict[str, Path]] = {}
 
     def set_language(self, language: str):
         """
@@ -40,9 +71,8 @@ class PromptLoader:
         if language not in ["zh", "en"]:
             raise ValueError(f"Unsupported language: {language}, only 'zh' or 'en' supported")
 
+        # Cache keys include the language, so other languages stay warm
         self.language = language
-        # Clear cache because language changed
-        self._cache.clear()
 
     def load(self, agent_name: str, version: str = "latest") -> dict[str, str]:
         """
@@ -63,11 +93,16 @@ class PromptLoader:
             FileNotFoundError: If corresponding YAML file not found
             ValueError: If YAML format is incorrect
         """
-        cache_key = f"{agent_name}_{version}_{self.language}"
+        name_key = (agent_name, version, self.language)
 
-        # Check cache
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        # Check cache (entry is only valid while the file is unchanged on disk)
+        file_key = self._name_to_key.get(name_key)
+        if file_key is not None and file_key in self._cache:
+            if self._file_key(Path(file_key[0])) == file_key:
+                self._cache.move_to_end(file_key)
+                return self._cache[file_key]
+            # File edited or removed since it was cached: drop the stale entry
+            del self._cache[file_key]
 
         # Build file path (supports subdirectory search)
         # First try direct path
@@ -77,10 +112,12 @@ class PromptLoader:
         if not prompt_file.exists():
             lang_dir = self.base_dir / self.language
             if lang_dir.exists():
-                # Search in all subdirectories
-                found_files = list(lang_dir.rglob(f"{agent_name}.yaml"))
-                if found_files:
-                    prompt_file = found_files[0]
+                # Look up the per-language index (rebuilt if the indexed file has moved)
+                found_file = self._index_for(self.language).get(agent_name)
+                if found_file is None or not found_file.exists():
+                    found_file = self._index_for(self.language, rebuild=True).get(agent_name)
+                if found_file is not None:
+                    prompt_file = found_file
                 else:
                     raise FileNotFoundError(
                         f"Prompt config file not found: {agent_name}.yaml\n"
@@ -91,10 +128,31 @@ class PromptLoader:
                     f"Prompt config directory not found: {lang_dir}\nPlease ensure directory exists"
                 )
 
+        file_key = self._file_key(prompt_file)
+        self._name_to_key[name_key] = file_key
+        if file_key in self._cache:
+            self._cache.move_to_end(file_key)
+            return self._cache[file_key]
+
+        prompts = self._load_file(prompt_file, file_key, agent_name)
+        self._cache_put(file_key, prompts)
+
+        return prompts
+
+    def _load_file(
+        self, prompt_file: Path, file_key: tuple[str, int, int] | None, agent_name: str
+    ) -> dict[str, str]:
+        """Parse, validate and build prompts for one file (touches no in-memory cache)"""
+        # Reuse prompts built by a previous process for this exact file version
+        prompts = self._read_sidecar(file_key)
+        if prompts is not None:
+            return prompts
+
         # Load YAML
         try:
-            with open(prompt_file, encoding="utf-8") as f:
-                config = yaml.safe_load(f)
+            # Binary mode: libyaml decodes UTF-8 itself, skipping the TextIOWrapper layer
+            with open(prompt_file, "rb") as f:
+                config = yaml.load(f, Loader=CSafeLoader)
         except Exception as e:
             raise ValueError(f"Failed to parse YAML file ({prompt_file}): {e!s}")
 
@@ -104,11 +162,121 @@ class PromptLoader:
         # Build Prompt
         prompts = self._build_prompts(config, config_type)
 
-        # Cache result
-        self._cache[cache_key] = prompts
+        self._write_sidecar(file_key, prompts)
 
         return prompts
 
+    def prefetch_all(self, max_workers: int = 8) -> dict[str, dict[str, str]]:
+        """
+        Load every prompt file of the current language in parallel (e.g. at server startup)
+
+        Files that fail to load are skipped, so one bad file does not block the rest.
+
+        Args:
+            max_workers: Thread pool size
+
+        Returns:
+            {agent_name: prompts} for the files that loaded successfully
+        """
+        lang_dir = self.base_dir / self.language
+        if not lang_dir.exists():
+            return {}
+
+        # Same resolution as load(): direct path first, then subdirectories
+        files = {}
+        for agent_name, path in self._index_for(self.language, rebuild=True).items():
+            direct_file = lang_dir / f"{agent_name}.yaml"
+            files[agent_name] = direct_file if direct_file.exists() else path
+
+        def build(agent_name: str, prompt_file: Path):
+            file_key = self._file_key(prompt_file)
+            return file_key, self._load_file(prompt_file, file_key, agent_name)
+
+        loaded = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {pool.submit(build, name, path): name for name, path in files.items()}
+            # Cache updates stay on this thread
+            for future in as_completed(futures):
+                agent_name = futures[future]
+                try:
+                    file_key, prompts = future.result()
+                except Exception:
+                    continue
+                self._name_to_key[(agent_name, "latest", self.language)] = file_key
+                self._cache_put(file_key, prompts)
+                loaded[agent_name] = prompts
+
+        return loaded
+
+    def _cache_put(self, file_key: tuple[str, int, int], prompts: dict[str, str]):
+        """Cache result, evicting the least recently used entry when full"""
+        self._cache[file_key] = prompts
+        if len(self._cache) > self._cache_max:
+            self._cache.popitem(last=False)
+
+    @staticmethod
+    def _sidecar_path(file_key: tuple[str, int, int]) -> Path:
+        """Pickle path for a prompt file (one per path, so a new version replaces the old one)"""
+        digest = hashlib.sha1(repr((_SIDECAR_VERSION, file_key[0])).encode("utf-8")).hexdigest()
+        return _SIDECAR_DIR / f"{digest}.pkl"
+
+    @staticmethod
+    def _sidecar_dir_trusted() -> bool:
+        """Only unpickle from a cache directory owned by the current user"""
+        try:
+            st = _SIDECAR_DIR.stat()
+        except OSError:
+            return False
+        return not hasattr(os, "getuid") or st.st_uid == os.getuid()
+
+    def _read_sidecar(self, file_key: tuple[str, int, int] | None) -> dict[str, str] | None:
+        """Load pickled prompts for this file version, or None (errors are ignored)"""
+        if file_key is None or not self._sidecar_dir_trusted():
+            return None
+        try:
+            with open(self._sidecar_path(file_key), "rb") as f:
+                stored_key, prompts = pickle.load(f)
+        except Exception:
+            return None
+        # The pickle belongs to whichever version was built last; reuse it only if that is this one
+        if stored_key != file_key or not isinstance(prompts, dict):
+            return None
+        return prompts
+
+    def _write_sidecar(self, file_key: tuple[str, int, int] | None, prompts: dict[str, str]):
+        """Persist built prompts for later processes, replacing any older version (errors are ignored)"""
+        if file_key is None:
+            return
+        try:
+            _SIDECAR_DIR.mkdir(mode=0o700, exist_ok=True)
+            if not self._sidecar_dir_trusted():
+                return
+            cache_path = self._sidecar_path(file_key)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump((file_key, prompts), f, protocol=5)
+            os.replace(tmp_path, cache_path)
+        except Exception:
+            pass
+
+    def _index_for(self, language: str, rebuild: bool = False) -> dict[str, Path]:
+        """Map agent names to prompt files under base_dir/language (including subdirectories)"""
+        if rebuild or language not in self._index:
+            index: dict[str, Path] = {}
+            for path in sorted((self.base_dir / language).rglob("*.yaml")):
+                index.setdefault(path.stem, path)
+            self._index[language] = index
+        return self._index[language]
+
+    @staticmethod
+    def _file_key(prompt_file: Path) -> tuple[str, int, int] | None:
+        """Cache key identifying the current on-disk version of a prompt file"""
+        try:
+            st = prompt_file.stat()
+        except OSError:
+            return None
+        return (str(prompt_file), st.st_mtime_ns, st.st_size)
+
     def _validate_config(self, config: dict[str, Any], agent_name: str) -> str:
         """
         Validate configuration structure integrity
@@ -120,6 +288,9 @@ class PromptLoader:
         Raises:
             ValueError: If configuration structure is incorrect
         """
+        if not isinstance(config, dict):
+            raise ValueError(f"[{agent_name}] prompt configuration must be a mapping")
+
         if "system" not in config:
             raise ValueError(f"[{agent_name}] missing 'system' configuration section")
 
@@ -137,7 +308,7 @@ class PromptLoader:
                     )
 
             user_config = config["user"]
-            if "template" not in user_config:
+            if not isinstance(user_config, dict) or "template" not in user_config:
                 raise ValueError(
                     f"[{agent_name}] 'user' configuration section missing 'template' field"
                 )
@@ -173,43 +344,26 @@ class PromptLoader:
             system_config = config["system"]
             user_config = config["user"]
 
-            system_parts = []
-            system_parts.append(f"You are {system_config['role']}.")
-            system_parts.append("")
-            system_parts.append(system_config["task"])
-
-            if system_config.get("requirements"):
-                system_parts.append("")
-                system_parts.append("Requirements:")
-                for req in system_config["requirements"]:
-                    system_parts.append(f"- {req}")
-
-            if system_config.get("constraints"):
-                system_parts.append("")
-                system_parts.append("Constraints:")
-                for cons in system_config["constraints"]:
-                    system_parts.append(f"- {cons}")
-
-            output_format = ""
-            if system_config.get("output_format"):
-                system_parts.append("")
-                system_parts.append("Output Format:")
-                system_parts.append(system_config["output_format"])
-                output_format = system_config["output_format"]
-
-            if system_config.get("notes"):
-                system_parts.append("")
-                system_parts.append("Notes:")
-                for note in system_config["notes"]:
-                    system_parts.append(f"- {note}")
-
-            system_prompt = "\n".join(system_parts)
-            user_template = user_config["template"]
+            system_parts = [f"You are {system_config['role']}.", "", system_config["task"]]
+
+            # Fixed section table: one pass, appending only the sections present
+            for key, heading, is_list in _STRUCTURED_SECTIONS:
+                value = system_config.get(key)
+                if not value:
+                    continue
+                system_parts += ("", f"{heading}:")
+                if is_list:
+                    system_parts += (f"- {item}" for item in value)
+                else:
+                    system_parts.append(value)
 
+            output_format = system_config.get("output_format") or ""
+
+            # Interned so agents/versions sharing prompt text share one string
             return {
-                "system": system_prompt,
-                "user_template": user_template,
-                "output_format": output_format,
+                "system": sys.intern("\n".join(system_parts)),
+                "user_template": sys.intern(user_config["template"]),
+                "output_format": sys.intern(output_format),
             }
 
         prompts = {"system": config["system"], "user_template": config.get("user_template", "")}
@@ -219,7 +373,7 @@ class PromptLoader:
                 continue
             prompts[key] = value
 
-        return prompts
+        return {k: sys.intern(v) if type(v) is str else v for k, v in prompts.items()}
 
     def list_available_prompts(self, language: str | None = None) -> list:
         """
@@ -248,6 +402,8 @@ class PromptLoader:
     def clear_cache(self):
         """Clear cache"""
         self._cache.clear()
+        self._name_to_key.clear()
+        self._index.clear()
 
     def reload(self, agent_name: str, version: str = "latest") -> dict[str, str]:
         """
@@ -260,11 +416,10 @@ class PromptLoader:
         Returns:
             Prompt configuration
         """
-        cache_key = f"{agent_name}_{version}_{self.language}"
-
         # Delete cache
-        if cache_key in self._cache:
-            del self._cache[cache_key]
+        file_key = self._name_to_key.pop((agent_name, version, self.language), None)
+        if file_key is not None:
+            self._cache.pop(file_key, None)
 
         # Reload
         return self.load(agent_name, version)
@@ -1,27 +1,46 @@
+import asyncio
 from contextlib import asynccontextmanager
-from pathlib import Path
+import importlib
+import os
 
+from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
-from src.api.routers import (
-    co_writer,
-    dashboard,
-    guide,
-    ideagen,
-    knowledge,
-    notebook,
-    question,
-    research,
-    settings,
-    solve,
-    system,
-)
 from src.core.logging import get_logger
+from src.core.logging.handlers import shutdown_logging
+from src.core.logging.log_forwarder import init_system_logger
+from src.core.paths import PROJECT_ROOT
 
 logger = get_logger("API")
 
+# (module under src.api.routers, URL prefix, tag)
+# Imported on startup rather than at module load, since each pulls in agent/LLM deps
+ROUTERS = [
+    ("solve", "/api/v1", "solve"),
+    ("question", "/api/v1/question", "question"),
+    ("research", "/api/v1/research", "research"),
+    ("knowledge", "/api/v1/knowledge", "knowledge"),
+    ("dashboard", "/api/v1/dashboard", "dashboard"),
+    ("co_writer", "/api/v1/co_writer", "co_writer"),
+    ("notebook", "/api/v1/notebook", "notebook"),
+    ("guide", "/api/v1/guide", "guide"),
+    ("ideagen", "/api/v1/ideagen", "ideagen"),
+    ("settings", "/api/v1/settings", "settings"),
+    ("system", "/api/v1/system", "system"),
+]
+
+
+def register_routers(app: FastAPI):
+    """Import and include all API routers (idempotent)"""
+    if getattr(app.state, "routers_registered", False):
+        return
+    for module_name, prefix, tag in ROUTERS:
+        module = importlib.import_module(f"src.api.routers.{module_name}")
+        app.include_router(module.router, prefix=prefix, tags=[tag])
+    app.state.routers_registered = True
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -31,17 +50,42 @@ async def lifespan(app: FastAPI):
     """
     # Execute on startup
     logger.info("Application startup")
+    try:
+        init_system_logger(project_root)
+    except Exception as e:
+        logger.warning(f"System log initialization failed: {e}")
+    register_routers(app)
+
+    # Warm solve prompts so the first request does not pay for YAML parsing
+    try:
+        from src.agents.solve.base_agent import BaseAgent
+        from src.core.core import load_config_with_main
+
+        config = load_config_with_main("solve_config.yaml", project_root)
+        language = config.get("system", {}).get("language", "zh")
+        count = await asyncio.to_thread(BaseAgent.prefetch_prompts, language)
+        logger.info(f"Prefetched {count} prompt files")
+    except Exception as e:
+        logger.warning(f"Prompt prefetch failed: {e}")
+
     yield
     # Execute on shutdown
     logger.info("Application shutdown")
+    shutdown_logging()
 
 
 app = FastAPI(title="DeepTutor API", version="1.0.0", lifespan=lifespan)
 
 # Configure CORS
+# CORS_ORIGINS: comma-separated frontend origins, e.g. "http://localhost:3782".
+# An explicit list is matched by set lookup; the "*" default echoes any origin.
+load_dotenv(PROJECT_ROOT / ".env", override=False)
+cors_origins = [
+    origin.strip() for origin in os.getenv("CORS_ORIGINS", "*").split(",") if origin.strip()
+]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, replace with specific frontend origin
+    allow_origins=cors_origins or ["*"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -51,7 +95,7 @@ app.add_middleware(
 # This allows frontend to access generated artifacts (images, PDFs, etc.)
 # URL: /api/outputs/solve/solve_xxx/artifacts/image.png
 # Physical Path: DeepTutor/data/user/solve/solve_xxx/artifacts/image.png
-project_root = Path(__file__).parent.parent.parent
+project_root = PROJECT_ROOT
 user_dir = project_root / "data" / "user"
 
 # Initialize user directories on startup
@@ -66,19 +110,6 @@ except Exception:
 
 app.mount("/api/outputs", StaticFiles(directory=str(user_dir)), name="outputs")
 
-# Include routers
-app.include_router(solve.router, prefix="/api/v1", tags=["solve"])
-app.include_router(question.router, prefix="/api/v1/question", tags=["question"])
-app.include_router(research.router, prefix="/api/v1/research", tags=["research"])
-app.include_router(knowledge.router, prefix="/api/v1/knowledge", tags=["knowledge"])
-app.include_router(dashboard.router, prefix="/api/v1/dashboard", tags=["dashboard"])
-app.include_router(co_writer.router, prefix="/api/v1/co_writer", tags=["co_writer"])
-app.include_router(notebook.router, prefix="/api/v1/notebook", tags=["notebook"])
-app.include_router(guide.router, prefix="/api/v1/guide", tags=["guide"])
-app.include_router(ideagen.router, prefix="/api/v1/ideagen", tags=["ideagen"])
-app.include_router(settings.router, prefix="/api/v1/settings", tags=["settings"])
-app.include_router(system.router, prefix="/api/v1/system", tags=["system"])
-
 
 @app.get("/")
 async def root():
@@ -86,16 +117,11 @@ async def root():
 
 
 if __name__ == "__main__":
-    from pathlib import Path
-
-    import uvicorn
-
-    # Get project root directory
-    project_root = Path(__file__).parent.parent.parent
-
     # Ensure project root is in Python path
     import sys
 
+    import uvicorn
+
     if str(project_root) not in sys.path:
         sys.path.insert(0, str(project_root))
 
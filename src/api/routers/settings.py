@@ -12,10 +12,9 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
 from src.core.core import get_embedding_config, get_llm_config, get_tts_config
-from src.utils.config_manager import ConfigManager
+from src.utils.config_manager import config_manager
 
 router = APIRouter()
-config_manager = ConfigManager()
 
 # ==================== Environment Variables Configuration ====================
 # Define all supported environment variables with descriptions
@@ -272,7 +271,8 @@ async def get_settings():
     3. Environment Info (models, etc)
     """
     ui_settings = load_ui_settings()
-    main_config = config_manager.load_config()
+    # Response bodies must be plain dicts: the cached read-only view is not serializable
+    main_config = config_manager.load_config_copy()
     env_info = config_manager.get_env_info()
 
     return {"ui": ui_settings, "config": main_config, "env": env_info}
@@ -289,7 +289,7 @@ async def update_config(update: ConfigUpdate):
     if not success:
         raise HTTPException(status_code=500, detail="Failed to save configuration")
 
-    return config_manager.load_config()
+    return config_manager.load_config_copy()
 
 
 @router.put("/theme")
@@ -351,7 +351,7 @@ class SystemLanguageUpdate(BaseModel):
 @router.put("/system-language")
 async def update_system_language(update: SystemLanguageUpdate):
     """Update system language in main.yaml"""
-    config = config_manager.load_config()
+    config = config_manager.load_config_copy()
     if "system" not in config:
         config["system"] = {}
     config["system"]["language"] = update.language
@@ -34,26 +34,34 @@ if __name__ == "__main__":
 
     backend_port = get_backend_port(project_root)
 
-    # Configure reload_excludes to skip temporary files and output directories
-    reload_excludes = [
-        "**/run_code_workspace/**",  # Code execution workspace
-        "**/tmp*/**",  # All temp directories
-        "**/__pycache__/**",  # Python cache
-        "**/*.pyc",  # Python compiled files
-        "**/user/solve/**",  # Solve output directory
-        "**/user/question/**",  # Question output directory
-        "**/user/research/**",  # Research output directory
-        "**/user/co-writer/**",  # Co-Writer output directory
-        "**/logs/**",  # Logs directory
-        "**/user/logs/**",  # User logs directory
-    ]
-
-    # Start uvicorn server with reload enabled
+    # Auto-reload is for development only: set DEEPTUTOR_RELOAD=1 to enable it
+    reload = os.environ.get("DEEPTUTOR_RELOAD", "0") == "1"
+
+    reload_kwargs = {}
+    if reload:
+        reload_kwargs = {
+            # Only watch source code; data/ and web/ changes never need a restart
+            "reload_dirs": ["src"],
+            # Skip temporary files and output directories
+            "reload_excludes": [
+                "**/run_code_workspace/**",  # Code execution workspace
+                "**/tmp*/**",  # All temp directories
+                "**/__pycache__/**",  # Python cache
+                "**/*.pyc",  # Python compiled files
+                "**/user/solve/**",  # Solve output directory
+                "**/user/question/**",  # Question output directory
+                "**/user/research/**",  # Research output directory
+                "**/user/co-writer/**",  # Co-Writer output directory
+                "**/logs/**",  # Logs directory
+                "**/user/logs/**",  # User logs directory
+            ],
+        }
+
     uvicorn.run(
         "src.api.main:app",
         host="0.0.0.0",
         port=backend_port,
-        reload=True,
-        reload_excludes=reload_excludes,
+        reload=reload,
         log_level="info",
+        **reload_kwargs,
     )
@@ -4,6 +4,8 @@ Unified Configuration Management
 Combines environment variable configuration and YAML configuration loading.
 """
 
+import copy
+import functools
 import os
 from pathlib import Path
 from typing import Any
@@ -144,7 +146,18 @@ def get_agent_params(module_name: str) -> dict:
         >>> params = get_agent_params("guide")
         >>> params["temperature"]  # 0.5
         >>> params["max_tokens"]   # 8192
+
+    Note:
+        Results are cached until agents.yaml changes on disk; each call returns a new dict.
     """
+    # PROJECT_ROOT is the project root directory, so config is at PROJECT_ROOT/config/
+    config_path = PROJECT_ROOT / "config" / "agents.yaml"
+    return dict(_load_agent_params(module_name, config_path, _mtime_ns(config_path)))
+
+
+@functools.lru_cache(maxsize=32)
+def _load_agent_params(module_name: str, config_path: Path, mtime_ns: int | None) -> dict:
+    """Agent parameters for a module (mtime_ns is part of the cache key so edits invalidate it)"""
     # Default values
     defaults = {
         "temperature": 0.5,
@@ -153,12 +166,8 @@ def get_agent_params(module_name: str) -> dict:
 
     # Try to load from agents.yaml
     try:
-        # PROJECT_ROOT is the project root directory, so config is at PROJECT_ROOT/config/
-        config_path = PROJECT_ROOT / "config" / "agents.yaml"
-
-        if config_path.exists():
-            with open(config_path, encoding="utf-8") as f:
-                agents_config = yaml.safe_load(f) or {}
+        if mtime_ns is not None:
+            agents_config = _load_yaml_file(config_path, mtime_ns) or {}
 
             if module_name in agents_config:
                 module_config = agents_config[module_name]
@@ -222,48 +231,72 @@ def get_embedding_config() -> dict:
 # ============================================================================
 
 
-def load_config_with_main(config_file: str, project_root: Path | None = None) -> dict[str, Any]:
-    """
-    Load configuration file, automatically merge with main.yaml common configuration
+@functools.lru_cache(maxsize=32)
+def _load_yaml_file(path: Path, mtime_ns: int) -> Any:
+    """Parse a YAML file (mtime_ns is part of the cache key so edits on disk invalidate it)"""
+    with open(path, encoding="utf-8") as f:
+        return yaml.safe_load(f)
 
-    Args:
-        config_file: Sub-module configuration file name (e.g., "solve_config.yaml")
-        project_root: Project root directory (if None, will try to auto-detect)
 
-    Returns:
-        Merged configuration dictionary
-    """
-    if project_root is None:
-        # Try to infer project root from current file location
-        # From src/core/core.py -> project root
-        project_root = Path(__file__).parent.parent.parent
+def _mtime_ns(path: Path) -> int | None:
+    """Modification time of a file, or None if it does not exist"""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
 
-    config_dir = project_root / "config"
 
+@functools.lru_cache(maxsize=16)
+def _load_merged_config(
+    config_dir: Path, config_file: str, main_mtime_ns: int | None, module_mtime_ns: int | None
+) -> dict[str, Any]:
+    """Merge main.yaml with a module config (mtimes are part of the cache key so edits invalidate it)"""
     # 1. Load main.yaml (common configuration)
     main_config = {}
-    main_config_path = config_dir / "main.yaml"
-    if main_config_path.exists():
+    if main_mtime_ns is not None:
         try:
-            with open(main_config_path, encoding="utf-8") as f:
-                main_config = yaml.safe_load(f) or {}
+            main_config = _load_yaml_file(config_dir / "main.yaml", main_mtime_ns) or {}
         except Exception as e:
             print(f"⚠️ Failed to load main.yaml: {e}")
 
     # 2. Load sub-module configuration file
     module_config = {}
-    module_config_path = config_dir / config_file
-    if module_config_path.exists():
+    if module_mtime_ns is not None:
         try:
-            with open(module_config_path, encoding="utf-8") as f:
-                module_config = yaml.safe_load(f) or {}
+            module_config = _load_yaml_file(config_dir / config_file, module_mtime_ns) or {}
         except Exception as e:
             print(f"⚠️ Failed to load {config_file}: {e}")
 
     # 3. Merge configurations: main.yaml as base, sub-module config overrides
-    merged_config = _deep_merge(main_config, module_config)
+    return _deep_merge(main_config, module_config)
+
 
-    return merged_config
+def load_config_with_main(config_file: str, project_root: Path | None = None) -> dict[str, Any]:
+    """
+    Load configuration file, automatically merge with main.yaml common configuration
+
+    The merged result is cached until either file changes on disk; callers get a private copy.
+
+    Args:
+        config_file: Sub-module configuration file name (e.g., "solve_config.yaml")
+        project_root: Project root directory (if None, will try to auto-detect)
+
+    Returns:
+        Merged configuration dictionary
+    """
+    if project_root is None:
+        # Try to infer project root from current file location
+        # From src/core/core.py -> project root
+        project_root = Path(__file__).parent.parent.parent
+
+    config_dir = Path(project_root) / "config"
+    merged_config = _load_merged_config(
+        config_dir,
+        config_file,
+        _mtime_ns(config_dir / "main.yaml"),
+        _mtime_ns(config_dir / config_file),
+    )
+    return copy.deepcopy(merged_config)
 
 
 def _deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
@@ -336,15 +369,22 @@ def parse_language(language: Any) -> str:
         return "zh"
 
     if isinstance(language, str):
-        lang_lower = language.lower()
-        if lang_lower in ["en", "english"]:
-            return "en"
-        if lang_lower in ["zh", "chinese"]:
-            return "zh"
+        return _parse_language_str(language)
 
     return "zh"  # Default Chinese
 
 
+@functools.lru_cache(maxsize=None)
+def _parse_language_str(language: str) -> str:
+    """Cached string branch of parse_language (non-string inputs may be unhashable)"""
+    lang_lower = language.lower()
+    if lang_lower in ["en", "english"]:
+        return "en"
+    if lang_lower in ["zh", "chinese"]:
+        return "zh"
+    return "zh"
+
+
 __all__ = [
     # Environment variable configuration
     "get_llm_config",
@@ -0,0 +1,36 @@
+"""
+Fast JSON
+orjson-backed JSON decoding with json.loads fallbacks, shared by the solve and ideagen agents.
+"""
+
+import json
+import re
+from typing import Any
+
+# Try importing orjson (optional, faster JSON decoding)
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# Integer literals this long may not fit orjson's 64-bit ints (it turns them into floats)
+_BIG_INT_RE = re.compile(r"\d{19,}")
+
+
+def loads(text: str) -> Any:
+    """
+    Parse JSON with orjson when available, falling back to json.loads.
+
+    json.loads is used for text orjson would reject or change: NaN/Infinity
+    literals, and integers too large for 64 bits. Raises ValueError on invalid JSON.
+    """
+    if orjson is None or _BIG_INT_RE.search(text):
+        return json.loads(text)
+    try:
+        return orjson.loads(text)
+    except ValueError:
+        # orjson is stricter than json (e.g. NaN); retry with the lenient parser
+        return json.loads(text)
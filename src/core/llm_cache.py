@@ -0,0 +1,49 @@
+"""
+LLM Response Cache
+Opt-in exact-match response cache (LLM_RESPONSE_CACHE=1) shared by the solve and ideagen agents.
+"""
+
+import hashlib
+import os
+
+LLM_CACHE_ENABLED = os.getenv("LLM_RESPONSE_CACHE", "").lower() in ("1", "true")
+LLM_CACHE_MAX_ENTRIES = 512
+
+# BLAKE2b digest of the request -> response text, oldest first
+_LLM_CACHE: dict[bytes, str] = {}
+
+
+def llm_cache_key(
+    model: str,
+    base_url: str | None,
+    system_prompt: str,
+    user_prompt: str,
+    temperature: float,
+    max_tokens: int | None,
+    response_format: dict[str, str] | None,
+) -> bytes:
+    """Digest of everything that determines the completion for a request"""
+    raw = "\x00".join(
+        (
+            model,
+            base_url or "",
+            system_prompt,
+            user_prompt,
+            f"{temperature:.3f}",
+            str(max_tokens),
+            str(response_format),
+        )
+    )
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).digest()
+
+
+def llm_cache_get(key: bytes) -> str | None:
+    """Return the cached response for a key, or None"""
+    return _LLM_CACHE.get(key)
+
+
+def llm_cache_put(key: bytes, response: str):
+    """Store a response, evicting the oldest entry once the cache is full"""
+    if key not in _LLM_CACHE and len(_LLM_CACHE) >= LLM_CACHE_MAX_ENTRIES:
+        del _LLM_CACHE[next(iter(_LLM_CACHE))]
+    _LLM_CACHE[key] = response
@@ -0,0 +1,72 @@
+"""
+LLM Call Limits
+Process-wide bound on in-flight LLM requests, shared by the solve and ideagen agents.
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import weakref
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MAX_CONCURRENCY = 16
+
+
+def _parse_max_concurrency(value: str | None) -> int:
+    """Parse LLM_MAX_CONCURRENCY: invalid values fall back to the default, and it is at least 1"""
+    if value is None or not value.strip():
+        return _DEFAULT_MAX_CONCURRENCY
+    try:
+        limit = int(value)
+    except ValueError:
+        logger.warning(f"Invalid LLM_MAX_CONCURRENCY={value!r}, using {_DEFAULT_MAX_CONCURRENCY}")
+        return _DEFAULT_MAX_CONCURRENCY
+    if limit < 1:
+        # A zero-permit semaphore would make every LLM call wait forever
+        logger.warning(f"LLM_MAX_CONCURRENCY={limit} is below 1, using 1")
+        return 1
+    return limit
+
+
+# Client-side bound on in-flight LLM requests, so bursts queue here instead of hitting rate limits
+LLM_MAX_CONCURRENCY = _parse_max_concurrency(os.getenv("LLM_MAX_CONCURRENCY"))
+
+# One semaphore per event loop: asyncio primitives are bound to the loop that first waits on them
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def llm_semaphore() -> asyncio.Semaphore:
+    """Return the LLM concurrency semaphore of the running event loop (must be awaited in)"""
+    loop = asyncio.get_running_loop()
+    sem = _semaphores.get(loop)
+    if sem is None:
+        sem = _semaphores[loop] = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+    return sem
+
+
+@functools.cache
+def get_openai_complete():
+    """lightrag's openai_complete_if_cache, imported on first use (its import chain is heavy)"""
+    from lightrag.llm.openai import openai_complete_if_cache
+
+    return openai_complete_if_cache
+
+
+@functools.cache
+def llm_call_errors() -> tuple[type[Exception], ...]:
+    """
+    Exceptions a failed completion call surfaces as, once lightrag's own retries are spent.
+
+    openai_complete_if_cache retries with tenacity without reraise, so rate-limit,
+    connection and timeout failures arrive as tenacity.RetryError.
+    """
+    import httpx
+    from lightrag.llm.openai import InvalidResponseError
+    from openai import OpenAIError
+    from tenacity import RetryError
+
+    return (RetryError, InvalidResponseError, httpx.HTTPError, OpenAIError)
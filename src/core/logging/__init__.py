@@ -21,6 +21,7 @@ Usage:
 from .handlers import (
     LogInterceptor,
     WebSocketLogHandler,
+    stream_logs,
 )
 from .lightrag_forward import (
     LightRAGLogContext,
@@ -44,4 +45,5 @@ __all__ = [
     "WebSocketLogHandler",
     "get_logger",
     "reset_logger",
+    "stream_logs",
 ]
@@ -9,6 +9,16 @@ import asyncio
 from datetime import datetime
 import json
 import logging
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+
+from .logger import ConsoleFormatter, enrich_filter
+
+# Try importing orjson (optional, faster JSON encoding)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class WebSocketLogHandler(logging.Handler):
@@ -24,17 +34,14 @@ class WebSocketLogHandler(logging.Handler):
         while True:
             log_entry = await queue.get()
             await websocket.send_json(log_entry)
+
+    With a bounded queue (``asyncio.Queue(maxsize=N)``) the handler acts as a ring
+    buffer: when the queue is full the oldest entry is dropped, so the latest
+    status messages always get through.
     """
 
-    # Symbols for different log types (matching ConsoleFormatter)
-    SYMBOLS = {
-        "DEBUG": "·",
-        "INFO": "○",
-        "SUCCESS": "✓",
-        "WARNING": "⚠",
-        "ERROR": "✗",
-        "CRITICAL": "✗",
-    }
+    # Symbols for different log types (shared with ConsoleFormatter)
+    SYMBOLS = ConsoleFormatter.SYMBOLS
 
     def __init__(self, queue: asyncio.Queue, include_module: bool = True):
         """
@@ -48,18 +55,35 @@ class WebSocketLogHandler(logging.Handler):
         self.queue = queue
         self.include_module = include_module
         self.setFormatter(logging.Formatter("%(message)s"))
+        self.addFilter(enrich_filter)
+        # Loop that owns the queue; records from other threads are handed to it
+        try:
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None
+
+    def _put(self, log_entry: dict):
+        """Put an entry into the queue, evicting the oldest one if it is full."""
+        if self.queue.full():
+            try:
+                self.queue.get_nowait()
+                self.queue.task_done()
+            except (asyncio.QueueEmpty, ValueError):
+                pass
+        try:
+            self.queue.put_nowait(log_entry)
+        except asyncio.QueueFull:
+            pass
 
     def emit(self, record: logging.LogRecord):
         """Emit a log record to the queue."""
         try:
             msg = self.format(record)
 
-            # Get symbol
-            display_level = getattr(record, "display_level", record.levelname)
-            symbol = getattr(record, "symbol", self.SYMBOLS.get(display_level, "○"))
-
-            # Get module name
-            module_name = getattr(record, "module_name", record.name)
+            # Set by enrich_filter
+            display_level = record.display_level
+            symbol = record.symbol
+            module_name = record.module_name
 
             # Build formatted content
             if self.include_module:
@@ -78,11 +102,18 @@ class WebSocketLogHandler(logging.Handler):
                 "timestamp": record.created,
             }
 
-            # Put into queue non-blocking
+            # asyncio.Queue is not thread-safe: only touch it from its own loop
             try:
-                self.queue.put_nowait(log_entry)
-            except asyncio.QueueFull:
-                pass  # Drop log if queue is full
+                running_loop = asyncio.get_running_loop()
+            except RuntimeError:
+                running_loop = None
+            if self._loop is not None and running_loop is not self._loop:
+                try:
+                    self._loop.call_soon_threadsafe(self._put, log_entry)
+                except RuntimeError:
+                    pass  # Loop already closed
+            else:
+                self._put(log_entry)
 
         except Exception:
             self.handleError(record)
@@ -99,6 +130,8 @@ class LogInterceptor:
         with LogInterceptor(logger, queue):
             # All logs from this logger will be streamed to queue
             solver.solve(problem)
+
+    To forward the queue with fewer WebSocket frames, see stream_logs().
     """
 
     def __init__(self, logger: logging.Logger, queue: asyncio.Queue, include_module: bool = True):
@@ -123,6 +156,47 @@ class LogInterceptor:
         self.logger.removeHandler(self.handler)
 
 
+async def stream_logs(queue: asyncio.Queue, websocket, max_batch: int = 50, max_wait_ms: int = 20):
+    """
+    Forward queued log entries to a WebSocket, coalescing bursts into one frame.
+
+    Each frame is a JSON array of up to ``max_batch`` entries, collected for at most
+    ``max_wait_ms`` after the first one arrives. The client must accept arrays.
+    Runs until cancelled or a send fails.
+
+    Args:
+        queue: Queue filled by a WebSocketLogHandler
+        websocket: Object with an async ``send_text`` method (e.g. fastapi.WebSocket)
+        max_batch: Maximum entries per frame
+        max_wait_ms: Maximum time to wait for more entries after the first
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await queue.get()]
+        deadline = loop.time() + max_wait_ms / 1000
+        while len(batch) < max_batch:
+            try:
+                batch.append(queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+
+        if orjson is not None:
+            text = orjson.dumps(batch, option=orjson.OPT_NON_STR_KEYS).decode()
+        else:
+            text = json.dumps(batch, ensure_ascii=False)
+        await websocket.send_text(text)
+        for _ in batch:
+            queue.task_done()
+
+
 class JSONFileHandler(logging.Handler):
     """
     A logging handler that writes structured JSON logs to a file.
@@ -140,21 +214,24 @@ class JSONFileHandler(logging.Handler):
 
         Args:
             filepath: Path to log file
-            encoding: File encoding
+            encoding: File encoding (orjson, when installed, always writes UTF-8)
         """
         super().__init__()
         self.filepath = filepath
         self.encoding = encoding
         self.setFormatter(logging.Formatter("%(message)s"))
+        self.addFilter(enrich_filter)
+        # Opened on first emit and kept open, like logging.FileHandler
+        self._fh = None
 
     def emit(self, record: logging.LogRecord):
         """Emit a log record as JSON."""
         try:
             # Build JSON entry
             entry = {
-                "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+                "timestamp": datetime.fromtimestamp(record.created),
                 "level": record.levelname,
-                "module": getattr(record, "module_name", record.name),
+                "module": record.module_name,
                 "message": self.format(record),
             }
 
@@ -163,13 +240,81 @@ class JSONFileHandler(logging.Handler):
                 if hasattr(record, key):
                     entry[key] = getattr(record, key)
 
-            # Write to file
-            with open(self.filepath, "a", encoding=self.encoding) as f:
-                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            if orjson is not None:
+                # Serializes datetime natively and always emits UTF-8
+                line = orjson.dumps(entry, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+            else:
+                entry["timestamp"] = entry["timestamp"].isoformat()
+                line = (json.dumps(entry, ensure_ascii=False) + "\n").encode(self.encoding)
+
+            # Write to file (emit runs under self.lock, taken by Handler.handle)
+            if self._fh is None:
+                self._fh = open(self.filepath, "ab")
+            self._fh.write(line)
+            if record.levelno >= logging.WARNING:
+                self._fh.flush()
 
         except Exception:
             self.handleError(record)
 
+    def flush(self):
+        """Flush buffered lines to disk."""
+        with self.lock:
+            if self._fh is not None:
+                self._fh.flush()
+
+    def close(self):
+        """Close the file handle (also called by logging.shutdown)."""
+        with self.lock:
+            try:
+                if self._fh is not None:
+                    self._fh.close()
+                    self._fh = None
+            finally:
+                super().close()
+
+
+class _TaskFileDispatcher(logging.Handler):
+    """Route queued records to the file handler registered for their logger name."""
+
+    def __init__(self):
+        super().__init__()
+        self.file_handlers: dict[str, logging.Handler] = {}
+
+    def emit(self, record: logging.LogRecord):
+        handler = self.file_handlers.get(record.name)
+        if handler is not None:
+            handler.handle(record)
+
+
+# Task log files are written by one background thread, so logging from async
+# request handlers never blocks the event loop on disk I/O
+_task_log_queue: SimpleQueue = SimpleQueue()
+_task_file_dispatcher = _TaskFileDispatcher()
+_task_log_listener: QueueListener | None = None
+
+
+def _start_task_log_listener():
+    global _task_log_listener
+    if _task_log_listener is None:
+        _task_log_listener = QueueListener(_task_log_queue, _task_file_dispatcher)
+        _task_log_listener.start()
+
+
+def shutdown_logging():
+    """
+    Flush pending task log records and close task log files.
+
+    Call on application shutdown. Later create_task_logger calls restart the writer.
+    """
+    global _task_log_listener
+    if _task_log_listener is not None:
+        _task_log_listener.stop()  # Drains the queue before returning
+        _task_log_listener = None
+    for handler in _task_file_dispatcher.file_handlers.values():
+        handler.close()
+    _task_file_dispatcher.file_handlers.clear()
+
 
 def create_task_logger(
     task_id: str, module_name: str, log_dir: str, queue: asyncio.Queue | None = None
@@ -198,7 +343,7 @@ def create_task_logger(
     logger.handlers.clear()
     logger.propagate = False
 
-    # File handler
+    # File handler, written from the background listener thread
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_file = log_path / f"{module_name}_{task_id}_{timestamp}.log"
 
@@ -207,7 +352,15 @@ def create_task_logger(
     file_handler.setFormatter(
         logging.Formatter("%(asctime)s [%(levelname)-8s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
     )
-    logger.addHandler(file_handler)
+    previous = _task_file_dispatcher.file_handlers.get(logger.name)
+    _task_file_dispatcher.file_handlers[logger.name] = file_handler
+    if previous is not None:
+        previous.close()
+    _start_task_log_listener()
+
+    queue_handler = QueueHandler(_task_log_queue)
+    queue_handler.setLevel(logging.DEBUG)
+    logger.addHandler(queue_handler)
 
     # WebSocket handler if queue provided
     if queue is not None:
@@ -7,9 +7,9 @@ Forwards LightRAG and RAG-Anything logs to DeepTutor's unified logging system.
 
 from contextlib import contextmanager
 import logging
-from pathlib import Path
 
 from src.core.core import load_config_with_main
+from src.core.paths import PROJECT_ROOT
 
 from .logger import get_logger
 
@@ -58,9 +58,7 @@ def get_lightrag_forwarding_config():
         dict: Configuration dictionary with defaults if not found
     """
     try:
-        # Use resolve() to get absolute path, ensuring correct project root regardless of working directory
-        project_root = Path(__file__).resolve().parent.parent.parent.parent
-        config = load_config_with_main("solve_config.yaml", project_root)
+        config = load_config_with_main("solve_config.yaml", PROJECT_ROOT)
 
         forwarding_config = config.get("logging", {}).get("lightrag_forwarding", {})
 
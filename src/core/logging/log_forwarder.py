@@ -7,6 +7,18 @@ import logging
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
+from src.core.paths import PROJECT_ROOT
+
+
+class SystemLogFormatter(logging.Formatter):
+    """Formatter supporting the module_name field"""
+
+    def format(self, record):
+        # If no module_name, use default value
+        if not hasattr(record, "module_name"):
+            record.module_name = "system"
+        return super().format(record)
+
 
 class SystemLogForwarder(logging.Handler):
     """
@@ -14,19 +26,19 @@ class SystemLogForwarder(logging.Handler):
     Used for question generation and problem solving modules, keeping their own logging systems while also writing to unified log
     """
 
-    _system_logger: logging.Logger | None = None
-    _initialized = False
+    # One rotating file handler shared by all forwarders
+    _system_handler: logging.Handler | None = None
 
     @classmethod
-    def get_system_logger(cls) -> logging.Logger:
-        """Get unified system logger"""
-        if cls._system_logger is None:
+    def get_system_handler(cls, project_root: Path | None = None) -> logging.Handler:
+        """Get unified system log file handler (created on first call, see init_system_logger)"""
+        if cls._system_handler is None:
+            if project_root is None:
+                project_root = PROJECT_ROOT
             # Get log directory from config (same logic as logger.py)
             try:
                 from src.core.core import get_path_from_config, load_config_with_main
 
-                # Use resolve() to get absolute path, ensuring correct project root regardless of working directory
-                project_root = Path(__file__).resolve().parent.parent.parent.parent
                 config = load_config_with_main("solve_config.yaml", project_root)
                 log_dir = get_path_from_config(config, "user_log_dir") or config.get(
                     "paths", {}
@@ -45,8 +57,6 @@ class SystemLogForwarder(logging.Handler):
                     log_dir = project_root / "data" / "user" / "logs"
             except Exception:
                 # Fallback to default: data/user/logs
-                # Use resolve() to get absolute path
-                project_root = Path(__file__).resolve().parent.parent.parent.parent
                 log_dir = project_root / "data" / "user" / "logs"
 
             # Ensure log directory exists
@@ -55,38 +65,23 @@ class SystemLogForwarder(logging.Handler):
             today = datetime.now().strftime("%Y%m%d")
             log_file = log_dir / f"ai_tutor_system_{today}.log"
 
-            # Create system logger
-            cls._system_logger = logging.getLogger("ai_tutor.system")
-            cls._system_logger.setLevel(logging.DEBUG)
-
-            # Only add file handler, don't add console handler (avoid duplicate output)
-            if not cls._system_logger.handlers:
-                file_handler = RotatingFileHandler(
-                    log_file,
-                    maxBytes=10 * 1024 * 1024,
-                    backupCount=5,
-                    encoding="utf-8",  # 10MB
-                )
-                file_handler.setLevel(logging.DEBUG)
-
-                # Custom formatter supporting module_name field
-                class SystemLogFormatter(logging.Formatter):
-                    def format(self, record):
-                        # If no module_name, use default value
-                        if not hasattr(record, "module_name"):
-                            record.module_name = "system"
-                        return super().format(record)
-
-                file_format = SystemLogFormatter(
+            # Only a file handler, no console handler (avoid duplicate output)
+            file_handler = RotatingFileHandler(
+                log_file,
+                maxBytes=10 * 1024 * 1024,
+                backupCount=5,
+                encoding="utf-8",  # 10MB
+            )
+            file_handler.setLevel(logging.DEBUG)
+            file_handler.setFormatter(
+                SystemLogFormatter(
                     "%(asctime)s | [%(module_name)s] | %(levelname)-8s | %(message)s",
                     datefmt="%Y-%m-%d %H:%M:%S",
                 )
-                file_handler.setFormatter(file_format)
-                cls._system_logger.addHandler(file_handler)
-
-            cls._initialized = True
+            )
+            cls._system_handler = file_handler
 
-        return cls._system_logger
+        return cls._system_handler
 
     def __init__(self, module_name: str):
         """
@@ -102,19 +97,28 @@ class SystemLogForwarder(logging.Handler):
     def emit(self, record: logging.LogRecord):
         """Forward log to unified system log file"""
         try:
-            # Get system logger
-            system_logger = self.get_system_logger()
-
             # Add module name to record
             record.module_name = self.module_name
 
-            # Forward log (using same level)
-            system_logger.handle(record)
+            # Write straight to the shared handler (no intermediate logger)
+            self.get_system_handler().handle(record)
         except Exception:
             # Forward failure should not affect original log
             self.handleError(record)
 
 
+def init_system_logger(project_root: Path | None = None) -> logging.Handler:
+    """
+    Create the unified system log handler ahead of time (e.g. at server startup)
+
+    Otherwise the config load and file handler setup happen on the first forwarded record.
+
+    Args:
+        project_root: Project root directory (defaults to the repository root)
+    """
+    return SystemLogForwarder.get_system_handler(project_root)
+
+
 def attach_system_log_forwarder(logger: logging.Logger, module_name: str):
     """
     Attach system log forwarder to specified logger
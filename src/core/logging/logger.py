@@ -20,6 +20,8 @@ from pathlib import Path
 import sys
 from typing import Any
 
+from src.core.paths import PROJECT_ROOT
+
 
 class LogLevel(Enum):
     """Log levels with associated symbols"""
@@ -64,22 +66,18 @@ class ConsoleFormatter(logging.Formatter):
     }
 
     def format(self, record: logging.LogRecord) -> str:
+        # module_name / symbol / display_level are set by RecordEnrichFilter
         # Get module name (padded to 12 chars for alignment)
-        module = getattr(record, "module_name", record.name)
-        module_padded = f"[{module}]".ljust(14)
-
-        # Get symbol (can be overridden via record.symbol)
-        symbol = getattr(record, "symbol", self.SYMBOLS.get(record.levelname, "○"))
+        module_padded = f"[{record.module_name}]".ljust(14)
 
         # Get color
-        level = getattr(record, "display_level", record.levelname)
-        color = self.COLORS.get(level, self.COLORS["INFO"])
+        color = self.COLORS.get(record.display_level, self.COLORS["INFO"])
 
         # Format message
         message = record.getMessage()
 
         # Build output: [Module]    ✓ Message
-        return f"{self.DIM}{module_padded}{self.RESET} {color}{symbol}{self.RESET} {message}"
+        return f"{self.DIM}{module_padded}{self.RESET} {color}{record.symbol}{self.RESET} {message}"
 
 
 class FileFormatter(logging.Formatter):
@@ -94,11 +92,29 @@ class FileFormatter(logging.Formatter):
             datefmt="%Y-%m-%d %H:%M:%S",
         )
 
-    def format(self, record: logging.LogRecord) -> str:
-        # Ensure module_name exists
-        if not hasattr(record, "module_name"):
+
+class RecordEnrichFilter(logging.Filter):
+    """
+    Fill in module_name, symbol and display_level on a record if they are missing.
+
+    Records from Logger carry them already; records from plain loggers get defaults.
+    Attached to every handler so formatters and handlers can read the attributes
+    directly. Returns True - it never drops records.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        attrs = record.__dict__
+        if attrs.get("module_name") is None:
             record.module_name = record.name
-        return super().format(record)
+        if attrs.get("display_level") is None:
+            record.display_level = record.levelname
+        if attrs.get("symbol") is None:
+            record.symbol = ConsoleFormatter.SYMBOLS.get(record.display_level, "○")
+        return True
+
+
+# Stateless, so one instance is shared by all handlers
+enrich_filter = RecordEnrichFilter()
 
 
 class Logger:
@@ -149,15 +165,12 @@ class Logger:
         # Setup log directory
         if log_dir is None:
             # Default: DeepTutor/data/user/logs/
-            # Use resolve() to get absolute path, ensuring correct project root regardless of working directory
-            project_root = Path(__file__).resolve().parent.parent.parent.parent
-            log_dir = project_root / "data" / "user" / "logs"
+            log_dir = PROJECT_ROOT / "data" / "user" / "logs"
         else:
             log_dir = Path(log_dir)
             # If relative path, resolve it relative to project root
             if not log_dir.is_absolute():
-                project_root = Path(__file__).resolve().parent.parent.parent.parent
-                log_dir = project_root / log_dir
+                log_dir = PROJECT_ROOT / log_dir
 
         log_dir.mkdir(parents=True, exist_ok=True)
         self.log_dir = log_dir
@@ -167,6 +180,7 @@ class Logger:
             console_handler = logging.StreamHandler(sys.stdout)
             console_handler.setLevel(self.level)
             console_handler.setFormatter(ConsoleFormatter())
+            console_handler.addFilter(enrich_filter)
             self.logger.addHandler(console_handler)
 
         # File handler
@@ -177,6 +191,7 @@ class Logger:
             file_handler = logging.FileHandler(log_file, encoding="utf-8")
             file_handler.setLevel(logging.DEBUG)  # Log everything to file
             file_handler.setFormatter(FileFormatter())
+            file_handler.addFilter(enrich_filter)
             self.logger.addHandler(file_handler)
 
             self._log_file = log_file
@@ -207,6 +222,7 @@ class Logger:
         handler = logging.FileHandler(task_log_file, encoding="utf-8")
         handler.setLevel(logging.DEBUG)
         handler.setFormatter(FileFormatter())
+        handler.addFilter(enrich_filter)
         self.logger.addHandler(handler)
         self._task_handlers.append(handler)
 
@@ -607,6 +623,9 @@ def get_logger(
     """
     Get or create a logger instance.
 
+    Loggers are registered by name; later calls with the same name return the
+    existing instance unchanged (use reset_logger to rebuild it).
+
     Args:
         name: Module name
         level: Log level
@@ -619,6 +638,10 @@ def get_logger(
     """
     global _loggers
 
+    # Already initialized: skip config loading and handler wiring
+    if name in _loggers:
+        return _loggers[name]
+
     # If log_dir not provided, try to load from config
     if log_dir is None:
         try:
@@ -626,10 +649,8 @@ def get_logger(
 
             from src.core.core import get_path_from_config, load_config_with_main
 
-            # Use resolve() to get absolute path, ensuring correct project root regardless of working directory
-            project_root = Path(__file__).resolve().parent.parent.parent.parent
             config = load_config_with_main(
-                "solve_config.yaml", project_root
+                "solve_config.yaml", PROJECT_ROOT
             )  # Use any config to get main.yaml
             log_dir = get_path_from_config(config, "user_log_dir") or config.get("paths", {}).get(
                 "user_log_dir"
@@ -640,21 +661,20 @@ def get_logger(
                 if not log_dir_path.is_absolute():
                     # Remove leading ./ if present
                     log_dir_str = str(log_dir_path).lstrip("./")
-                    log_dir = str(project_root / log_dir_str)
+                    log_dir = str(PROJECT_ROOT / log_dir_str)
                 else:
                     log_dir = str(log_dir_path)
         except Exception:
             # Fallback to default
             pass
 
-    if name not in _loggers:
-        _loggers[name] = Logger(
-            name=name,
-            level=level,
-            console_output=console_output,
-            file_output=file_output,
-            log_dir=log_dir,
-        )
+    _loggers[name] = Logger(
+        name=name,
+        level=level,
+        console_output=console_output,
+        file_output=file_output,
+        log_dir=log_dir,
+    )
 
     return _loggers[name]
 
@@ -3,11 +3,15 @@ Unified Terminal Output Management System
 Reference solve_agents display design, providing unified terminal visualization for all modules
 """
 
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from itertools import islice
 import sys
+import threading
 import time
+from typing import TextIO
 
 
 class AgentStatus(Enum):
@@ -17,7 +21,36 @@ class AgentStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+_STATUS_FROM_STR: dict[str, AgentStatus] = {s.value: s for s in AgentStatus}
+
+# ANSI codes
+_RESET = "\033[0m"
+_BOLD = "\033[1m"
+_GRAY = "\033[90m"
+_FRAME = "\033[1;34m"  # Bold blue box drawing
+_EDGE = f"{_FRAME}║{_RESET}"
+
+_STATUS_SYMBOL: dict[AgentStatus, str] = {
+    AgentStatus.PENDING: "○",
+    AgentStatus.RUNNING: "●",
+    AgentStatus.DONE: "✓",
+    AgentStatus.ERROR: "✗",
+}
+
+_STATUS_COLOR: dict[AgentStatus, str] = {
+    AgentStatus.PENDING: "\033[90m",  # Gray
+    AgentStatus.RUNNING: "\033[33m",  # Yellow
+    AgentStatus.DONE: "\033[32m",  # Green
+    AgentStatus.ERROR: "\033[31m",  # Red
+}
+
+
+def _pad(plain: str, codes_prefix: str, codes_suffix: str, width: int) -> str:
+    """Wrap plain text in ANSI codes and pad it to width visible columns"""
+    return codes_prefix + plain + codes_suffix + " " * max(0, width - len(plain))
+
+
+@dataclass(slots=True)
 class TokenUsage:
     """Token usage statistics"""
 
@@ -31,7 +64,7 @@ class TokenUsage:
         return self.input_tokens + self.output_tokens
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentInfo:
     """Agent information"""
 
@@ -40,6 +73,8 @@ class AgentInfo:
     message: str = ""
     start_time: float | None = None
     end_time: float | None = None
+    # Cached display row; None while unset or while the agent is still running
+    _rendered_line: str | None = field(default=None, init=False, repr=False, compare=False)
 
 
 class TerminalDisplay:
@@ -48,12 +83,31 @@ class TerminalDisplay:
     Provides visualization of workflow progress, Agent status, Token consumption, etc.
     """
 
+    # Box borders (62 columns inside)
+    _TOP_BORDER = f"{_FRAME}╔{'═' * 62}╗{_RESET}"
+    _MID_BORDER = f"{_FRAME}╠{'═' * 62}╣{_RESET}"
+    _BOTTOM_BORDER = f"{_FRAME}╚{'═' * 62}╝{_RESET}"
+
+    # Row templates, filled with str.format
+    _TITLE_ROW = f"{_EDGE}  {_BOLD}{{:^58}}{_RESET}  {_EDGE}"
+    _CENTER_ROW = f"{_EDGE}  {{:^58}}  {_EDGE}"
+    _AGENT_ROW = f"{_EDGE}    {{}}  {_EDGE}"  # Cell is pre-padded by _render_agent_row
+    _TOKEN_ROW = f"{_EDGE}    {{:56}}  {_EDGE}"
+    _TOTAL_ROW = f"{_EDGE}    {_BOLD}{{:56}}{_RESET}  {_EDGE}"
+    _LOG_ROW = f"{_EDGE}    {_GRAY}{{:56}}{_RESET}  {_EDGE}"
+
+    # Section headers
+    _AGENTS_HEADER = f"{_EDGE}  {_BOLD}Agent Status{_RESET}{'':46}  {_EDGE}"
+    _TOKENS_HEADER = f"{_EDGE}  {_BOLD}Token Usage{_RESET}{'':47}  {_EDGE}"
+    _LOGS_HEADER = f"{_EDGE}  {_BOLD}Recent Logs{_RESET}{'':47}  {_EDGE}"
+
     def __init__(
         self,
         module_name: str,
         agents: list[str] | None = None,
         show_tokens: bool = True,
         show_time: bool = True,
+        out: TextIO | None = None,
     ):
         """
         Initialize terminal display manager
@@ -63,10 +117,13 @@ class TerminalDisplay:
             agents: Agent name list
             show_tokens: Whether to show token statistics
             show_time: Whether to show time information
+            out: Output stream (default: sys.stdout at paint time). Each frame is one
+                write + one flush, so a large-buffered stream keeps it to one syscall.
         """
         self.module_name = module_name
         self.show_tokens = show_tokens
         self.show_time = show_time
+        self._out = out
         self.start_time = time.time()
 
         # Agent status tracking
@@ -79,33 +136,21 @@ class TerminalDisplay:
         self.token_usage: dict[str, TokenUsage] = {}
         self.total_tokens = TokenUsage()
 
-        # Log buffer
-        self.log_buffer: list[str] = []
+        # Log buffer (bounded: oldest lines are dropped automatically)
         self.max_log_lines = 10
+        self.log_buffer: deque[str] = deque(maxlen=self.max_log_lines)
+
+        # Lines of the last painted frame, for differential repaint
+        self._last_frame: list[str] | None = None
 
-    def _get_status_symbol(self, status: AgentStatus) -> str:
-        """Get status symbol"""
-        symbols = {
-            AgentStatus.PENDING: "○",
-            AgentStatus.RUNNING: "●",
-            AgentStatus.DONE: "✓",
-            AgentStatus.ERROR: "✗",
-        }
-        return symbols.get(status, "?")
-
-    def _get_status_color(self, status: AgentStatus) -> str:
-        """Get status color ANSI code"""
-        colors = {
-            AgentStatus.PENDING: "\033[90m",  # Gray
-            AgentStatus.RUNNING: "\033[33m",  # Yellow
-            AgentStatus.DONE: "\033[32m",  # Green
-            AgentStatus.ERROR: "\033[31m",  # Red
-        }
-        return colors.get(status, "\033[0m")
-
-    def _reset_color(self) -> str:
-        """Reset color"""
-        return "\033[0m"
+        # Repaint throttling: updates within _min_interval are coalesced into one paint
+        self._dirty = False
+        self._last_paint = 0.0
+        self._min_interval = 0.05
+        self._flush_timer: threading.Timer | None = None
+        # Held while painting and while mutating agents/token_usage/log_buffer, since the
+        # flush timer renders from its own thread
+        self._paint_lock = threading.Lock()
 
     def set_agent_status(self, agent_name: str, status: str, message: str = ""):
         """
@@ -116,22 +161,29 @@ class TerminalDisplay:
             status: Status (pending, running, done, error)
             message: Status message
         """
-        status_enum = AgentStatus(status) if isinstance(status, str) else status
-
-        if agent_name not in self.agents:
-            self.agents[agent_name] = AgentInfo(name=agent_name)
-
-        agent = self.agents[agent_name]
-        old_status = agent.status
-        agent.status = status_enum
-        agent.message = message
-
-        if status_enum == AgentStatus.RUNNING and agent.start_time is None:
-            agent.start_time = time.time()
-        elif status_enum in (AgentStatus.DONE, AgentStatus.ERROR):
-            agent.end_time = time.time()
-
-        self._refresh_display()
+        if isinstance(status, str):
+            status_enum = _STATUS_FROM_STR.get(status)
+            if status_enum is None:
+                status_enum = AgentStatus(status)  # Raises ValueError for unknown statuses
+        else:
+            status_enum = status
+
+        with self._paint_lock:
+            if agent_name not in self.agents:
+                self.agents[agent_name] = AgentInfo(name=agent_name)
+
+            agent = self.agents[agent_name]
+            old_status = agent.status
+            agent.status = status_enum
+            agent.message = message
+            agent._rendered_line = None
+
+            if status_enum == AgentStatus.RUNNING and agent.start_time is None:
+                agent.start_time = time.time()
+            elif status_enum in (AgentStatus.DONE, AgentStatus.ERROR):
+                agent.end_time = time.time()
+
+        self._mark_dirty()
 
     def add_token_usage(self, model: str, input_tokens: int, output_tokens: int, cost: float = 0.0):
         """
@@ -143,118 +195,170 @@ class TerminalDisplay:
             output_tokens: Output token count
             cost: Cost (USD)
         """
-        if model not in self.token_usage:
-            self.token_usage[model] = TokenUsage(model=model)
+        with self._paint_lock:
+            if model not in self.token_usage:
+                self.token_usage[model] = TokenUsage(model=model)
 
-        usage = self.token_usage[model]
-        usage.input_tokens += input_tokens
-        usage.output_tokens += output_tokens
-        usage.cost += cost
+            usage = self.token_usage[model]
+            usage.input_tokens += input_tokens
+            usage.output_tokens += output_tokens
+            usage.cost += cost
 
-        # Update total
-        self.total_tokens.input_tokens += input_tokens
-        self.total_tokens.output_tokens += output_tokens
-        self.total_tokens.cost += cost
+            # Update total
+            self.total_tokens.input_tokens += input_tokens
+            self.total_tokens.output_tokens += output_tokens
+            self.total_tokens.cost += cost
 
-        self._refresh_display()
+        self._mark_dirty()
 
     def log(self, message: str):
         """Add log message"""
         timestamp = datetime.now().strftime("%H:%M:%S")
         log_line = f"[{timestamp}] {message}"
-        self.log_buffer.append(log_line)
-
-        # Maintain log buffer size
-        if len(self.log_buffer) > self.max_log_lines:
-            self.log_buffer = self.log_buffer[-self.max_log_lines :]
-
-        self._refresh_display()
-
-    def _refresh_display(self):
-        """Refresh terminal display"""
-        # Clear screen and move to top
-        print("\033[2J\033[H", end="")
+        with self._paint_lock:
+            self.log_buffer.append(log_line)
+
+        self._mark_dirty()
+
+    def _mark_dirty(self):
+        """Request a repaint; paints closer together than _min_interval are coalesced"""
+        self._dirty = True
+        since_paint = time.monotonic() - self._last_paint
+        if since_paint >= self._min_interval:
+            self._refresh_display()
+        elif self._flush_timer is None:
+            # Paint the remaining changes once the interval has passed
+            self._flush_timer = threading.Timer(self._min_interval - since_paint, self._flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _flush(self):
+        """Timer callback: paint if updates arrived since the last frame"""
+        self._flush_timer = None
+        if self._dirty:
+            self._refresh_display()
+
+    def _render_lines(self) -> list[str]:
+        """Build the current frame as a list of terminal lines"""
+        lines = [self._TOP_BORDER]
 
         # Title
-        elapsed = time.time() - self.start_time
-        print("\033[1;34m╔══════════════════════════════════════════════════════════════╗\033[0m")
-        print(f"\033[1;34m║\033[0m  \033[1m{self.module_name:^56}\033[0m  \033[1;34m║\033[0m")
+        lines.append(self._TITLE_ROW.format(self.module_name))
         if self.show_time:
-            time_str = f"Running: {elapsed:.1f}s"
-            print(f"\033[1;34m║\033[0m  {time_str:^56}  \033[1;34m║\033[0m")
-        print("\033[1;34m╠══════════════════════════════════════════════════════════════╣\033[0m")
+            elapsed = time.time() - self.start_time
+            lines.append(self._CENTER_ROW.format(f"Running: {elapsed:.1f}s"))
+        lines.append(self._MID_BORDER)
 
         # Agent status
         if self.agents:
-            print(f"\033[1;34m║\033[0m  \033[1mAgent Status\033[0m{'':43}  \033[1;34m║\033[0m")
+            lines.append(self._AGENTS_HEADER)
             for agent in self.agents.values():
-                symbol = self._get_status_symbol(agent.status)
-                color = self._get_status_color(agent.status)
-                reset = self._reset_color()
-
-                status_str = f"{color}{symbol} {agent.name}{reset}"
-                if agent.message:
-                    status_str += f" - {agent.message[:30]}"
-
-                # Calculate display time
-                if agent.start_time and agent.end_time:
-                    duration = agent.end_time - agent.start_time
-                    status_str += f" ({duration:.1f}s)"
-                elif agent.start_time:
-                    duration = time.time() - agent.start_time
-                    status_str += f" ({duration:.1f}s...)"
+                line = agent._rendered_line
+                if line is None:
+                    line = self._render_agent_row(agent)
+                lines.append(line)
 
-                # Need to handle ANSI escape sequence length when printing
-                print(f"\033[1;34m║\033[0m    {status_str:56}  \033[1;34m║\033[0m")
-
-            print(
-                "\033[1;34m╠══════════════════════════════════════════════════════════════╣\033[0m"
-            )
+            lines.append(self._MID_BORDER)
 
         # Token statistics
         if self.show_tokens and self.token_usage:
-            print(f"\033[1;34m║\033[0m  \033[1mToken Usage\033[0m{'':44}  \033[1;34m║\033[0m")
+            lines.append(self._TOKENS_HEADER)
             for model, usage in self.token_usage.items():
                 model_short = model[:20] + "..." if len(model) > 20 else model
                 tokens_str = f"{model_short}: {usage.total_tokens:,} tokens"
                 if usage.cost > 0:
                     tokens_str += f" (${usage.cost:.4f})"
-                print(f"\033[1;34m║\033[0m    {tokens_str:54}  \033[1;34m║\033[0m")
+                lines.append(self._TOKEN_ROW.format(tokens_str))
 
             # Total
             total_str = f"Total: {self.total_tokens.total_tokens:,} tokens"
             if self.total_tokens.cost > 0:
                 total_str += f" (${self.total_tokens.cost:.4f})"
-            print(f"\033[1;34m║\033[0m    \033[1m{total_str:54}\033[0m  \033[1;34m║\033[0m")
+            lines.append(self._TOTAL_ROW.format(total_str))
 
-            print(
-                "\033[1;34m╠══════════════════════════════════════════════════════════════╣\033[0m"
-            )
+            lines.append(self._MID_BORDER)
 
         # Logs
         if self.log_buffer:
-            print(f"\033[1;34m║\033[0m  \033[1mRecent Logs\033[0m{'':44}  \033[1;34m║\033[0m")
-            for log_line in self.log_buffer[-5:]:  # Only show last 5
+            lines.append(self._LOGS_HEADER)
+            # Only show last 5
+            for log_line in islice(self.log_buffer, max(0, len(self.log_buffer) - 5), None):
                 log_short = log_line[:52] + "..." if len(log_line) > 52 else log_line
-                print(f"\033[1;34m║\033[0m    \033[90m{log_short:54}\033[0m  \033[1;34m║\033[0m")
-            print(
-                "\033[1;34m╠══════════════════════════════════════════════════════════════╣\033[0m"
-            )
+                lines.append(self._LOG_ROW.format(log_short))
+            lines.append(self._MID_BORDER)
 
         # Bottom
-        print("\033[1;34m╚══════════════════════════════════════════════════════════════╝\033[0m")
+        lines.append(self._BOTTOM_BORDER)
+
+        return lines
+
+    def _render_agent_row(self, agent: AgentInfo) -> str:
+        """Build an agent's status row, caching it unless its timer is still ticking"""
+        head = f"{_STATUS_SYMBOL[agent.status]} {agent.name}"
+        tail = f" - {agent.message[:30]}" if agent.message else ""
+
+        # Calculate display time
+        running = False
+        if agent.start_time and agent.end_time:
+            duration = agent.end_time - agent.start_time
+            tail += f" ({duration:.1f}s)"
+        elif agent.start_time:
+            duration = time.time() - agent.start_time
+            tail += f" ({duration:.1f}s...)"
+            running = True
+
+        # Only the name is colored; pad on the visible length so ANSI codes don't count
+        cell = _pad(head, _STATUS_COLOR[agent.status], _RESET + tail, 56 - len(tail))
+        line = self._AGENT_ROW.format(cell)
+        if not running:
+            agent._rendered_line = line
+        return line
 
-        sys.stdout.flush()
+    def _refresh_display(self):
+        """Refresh terminal display (only rows that changed since the last frame are rewritten)"""
+        with self._paint_lock:
+            self._paint()
+
+    def _paint(self):
+        """Write the frame (caller holds _paint_lock)"""
+        self._dirty = False
+        self._last_paint = time.monotonic()
+        lines = self._render_lines()
+        previous = self._last_frame
+
+        if previous is None:
+            # First frame: clear screen and move to top
+            frame = "\033[2J\033[H" + "\n".join(lines) + "\n"
+        else:
+            parts = [
+                f"\033[{row};1H{line}\033[K"
+                for row, line in enumerate(lines, 1)
+                if row > len(previous) or line != previous[row - 1]
+            ]
+            if len(lines) < len(previous):
+                # Frame got shorter: clear the leftover rows
+                parts.append(f"\033[{len(lines) + 1};1H\033[J")
+            # Leave the cursor below the frame
+            parts.append(f"\033[{len(lines) + 1};1H")
+            frame = "".join(parts)
+
+        self._last_frame = lines
+        # One write per frame instead of one print per line
+        out = self._out or sys.stdout
+        out.write(frame)
+        out.flush()
 
     def complete(self, message: str = "Complete"):
         """Mark task as complete"""
         elapsed = time.time() - self.start_time
         self.log(f"✓ {message} ({elapsed:.1f}s)")
+        # Always paint the final frame, bypassing the throttle
         self._refresh_display()
 
     def error(self, message: str):
         """Mark task as error"""
         self.log(f"✗ Error: {message}")
+        # Always paint the final frame, bypassing the throttle
         self._refresh_display()
 
 
@@ -264,6 +368,11 @@ class SimpleProgress:
     Suitable for scenarios that don't need full TUI
     """
 
+    # Progress bar pieces, sliced per update instead of rebuilt
+    _BAR_LENGTH = 30
+    _FULL = "█" * _BAR_LENGTH
+    _EMPTY = "░" * _BAR_LENGTH
+
     def __init__(self, module_name: str):
         self.module_name = module_name
         self.start_time = time.time()
@@ -286,9 +395,9 @@ class SimpleProgress:
     def progress(self, current: int, total: int, message: str = ""):
         """Display progress bar"""
         percentage = (current / total) * 100 if total > 0 else 0
-        bar_length = 30
-        filled = int(bar_length * current / total) if total > 0 else 0
-        bar = "█" * filled + "░" * (bar_length - filled)
+        filled = int(self._BAR_LENGTH * current / total) if total > 0 else 0
+        filled = min(max(filled, 0), self._BAR_LENGTH)
+        bar = self._FULL[:filled] + self._EMPTY[filled:]
 
         print(f"\r[{bar}] {percentage:5.1f}% ({current}/{total}) {message}", end="", flush=True)
         if current >= total:
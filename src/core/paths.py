@@ -0,0 +1,9 @@
+"""
+Project Paths
+Absolute project root, resolved once at import.
+"""
+
+from pathlib import Path
+
+# DeepTutor/ (this file is DeepTutor/src/core/paths.py)
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
@@ -55,7 +55,7 @@ except Exception as e:
 from .code_executor import run_code, run_code_sync
 from .query_item_tool import query_numbered_item
 from .rag_tool import rag_search
-from .web_search import web_search
+from .web_search import web_search, web_search_async, web_search_many, web_search_stream
 
 # Paper research related tools
 try:
@@ -73,6 +73,9 @@ try:
         "run_code",
         "run_code_sync",
         "web_search",
+        "web_search_async",
+        "web_search_many",
+        "web_search_stream",
     ]
 except ImportError as e:
     # If import fails (e.g., missing tiktoken), only export basic tools
@@ -83,4 +86,7 @@ except ImportError as e:
         "run_code",
         "run_code_sync",
         "web_search",
+        "web_search_async",
+        "web_search_many",
+        "web_search_stream",
     ]
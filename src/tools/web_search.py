@@ -3,17 +3,170 @@
 Web Search Tool - Network search using Perplexity API
 """
 
+import asyncio
+from collections.abc import Generator
+import contextlib
 from datetime import datetime
+import functools
 import json
 import os
+from types import SimpleNamespace
 
+# Try importing orjson (optional, faster JSON encoding)
 try:
-    from perplexity import Perplexity
-
-    PERPLEXITY_AVAILABLE = True
+    import orjson
 except ImportError:
-    PERPLEXITY_AVAILABLE = False
-    Perplexity = None
+    orjson = None
+
+
+# Maximum number of in-flight requests for web_search_many (keeps clear of 429s)
+MAX_CONCURRENT_SEARCHES = 8
+
+
+@functools.cache
+def _perplexity():
+    """Import the perplexity SDK on first use (None if not installed)"""
+    try:
+        import perplexity
+    except ImportError:
+        return None
+    return perplexity
+
+
+@functools.lru_cache(maxsize=4)
+def _client(api_key: str):
+    """Perplexity client per API key, reused so its keep-alive connection pool survives calls"""
+    return _perplexity().Perplexity(api_key=api_key)
+
+
+def _get_api_key() -> str:
+    """Check that web search can run and return the Perplexity API key"""
+    # Check if perplexity module is available
+    if _perplexity() is None:
+        raise ImportError(
+            "perplexity module is not installed. To use web search functionality, please install the corresponding package.\n"
+            "Note: This is an optional feature and does not affect the use of other modules."
+        )
+
+    # Check API key
+    api_key = os.environ.get("PERPLEXITY_API_KEY")
+    if not api_key:
+        raise ValueError("PERPLEXITY_API_KEY environment variable is not set")
+    return api_key
+
+
+def _messages(query: str) -> list[dict]:
+    """Chat messages sent to Perplexity for a query"""
+    return [
+        {
+            "role": "system",
+            "content": "You are a helpful AI assistant. Provide detailed and accurate answers based on web search results.",
+        },
+        {"role": "user", "content": query},
+    ]
+
+
+def _build_result(query: str, completion) -> dict:
+    """Turn a Perplexity chat completion into the web_search result dictionary"""
+    # Extract response content
+    answer = completion.choices[0].message.content
+
+    # Usage is optional (e.g. a stream that never reported it); missing counts read as 0
+    usage = completion.usage
+    cost = getattr(usage, "cost", None)
+
+    # Build result dictionary
+    result = {
+        "timestamp": datetime.now().isoformat(),
+        "query": query,
+        "model": completion.model,
+        "answer": answer,
+        "response": {
+            "content": answer,
+            "role": completion.choices[0].message.role,
+            "finish_reason": completion.choices[0].finish_reason,
+        },
+        "usage": {
+            "prompt_tokens": getattr(usage, "prompt_tokens", 0),
+            "completion_tokens": getattr(usage, "completion_tokens", 0),
+            "total_tokens": getattr(usage, "total_tokens", 0),
+            "cost": {
+                "total_cost": getattr(cost, "total_cost", 0.0),
+                "input_tokens_cost": getattr(cost, "input_tokens_cost", 0.0),
+                "output_tokens_cost": getattr(cost, "output_tokens_cost", 0.0),
+            },
+        },
+        "citations": [],
+        "search_results": [],
+    }
+
+    # Extract search result details
+    if hasattr(completion, "search_results") and completion.search_results:
+        for search_item in completion.search_results:
+            search_result = {
+                "title": search_item.title,
+                "url": search_item.url,
+                "date": search_item.date,
+                "last_updated": search_item.last_updated,
+                "snippet": search_item.snippet,
+                "source": search_item.source,
+            }
+            result["search_results"].append(search_result)
+
+    # Extract citation links (improved: includes complete metadata)
+    if hasattr(completion, "citations") and completion.citations:
+        # Index search results by URL so each citation is matched in O(1);
+        # the first result for a URL wins, as with the previous linear scan
+        search_by_url = {}
+        for search_item in result["search_results"]:
+            search_by_url.setdefault(search_item["url"], search_item)
+
+        for i, citation_url in enumerate(completion.citations, 1):
+            citation_data = {
+                "id": i,
+                "reference": f"[{i}]",
+                "url": citation_url,
+                "title": "",
+                "snippet": "",
+            }
+
+            match = search_by_url.get(citation_url)
+            if match:
+                citation_data["title"] = match["title"] or ""
+                citation_data["snippet"] = match["snippet"] or ""
+
+            result["citations"].append(citation_data)
+
+    return result
+
+
+def _save_result(result: dict, output_dir: str, verbose: bool = False) -> str:
+    """Write a search result to output_dir as JSON and return the file path"""
+    os.makedirs(output_dir, exist_ok=True)
+    # Microseconds keep concurrent searches from overwriting each other's files
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    output_filename = f"search_{timestamp}.json"
+    output_path = os.path.join(output_dir, output_filename)
+
+    if orjson is not None:
+        data = orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        with open(output_path, "wb") as f:
+            f.write(data)
+    else:
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+    if verbose:
+        print(f"Search results saved to: {output_path}")
+
+    return output_path
+
+
+def _print_summary(result: dict):
+    """Print the query and a preview of the answer"""
+    answer = result["answer"]
+    print(f"Query: {result['query']}")
+    print(f"Answer: {answer[:200]}..." if len(answer) > 200 else answer)
 
 
 def web_search(query: str, output_dir: str | None = None, verbose: bool = False) -> dict:
@@ -38,118 +191,127 @@ def web_search(query: str, output_dir: str | None = None, verbose: bool = False)
         ValueError: If PERPLEXITY_API_KEY environment variable is not set
         Exception: If API call fails
     """
-    # Check if perplexity module is available
-    if not PERPLEXITY_AVAILABLE:
-        raise ImportError(
-            "perplexity module is not installed. To use web search functionality, please install the corresponding package.\n"
-            "Note: This is an optional feature and does not affect the use of other modules."
-        )
-
-    # Check API key
-    api_key = os.environ.get("PERPLEXITY_API_KEY")
-    if not api_key:
-        raise ValueError("PERPLEXITY_API_KEY environment variable is not set")
+    api_key = _get_api_key()
 
-    # Initialize client
-    client = Perplexity(api_key=api_key)
+    # Reuse the client (and its pooled connections, with the SDK's default retries)
+    client = _client(api_key)
 
     try:
         # Call API
-        completion = client.chat.completions.create(
-            model="sonar",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a helpful AI assistant. Provide detailed and accurate answers based on web search results.",
-                },
-                {"role": "user", "content": query},
-            ],
+        completion = client.chat.completions.create(model="sonar", messages=_messages(query))
+        result = _build_result(query, completion)
+
+        # If output directory provided, save results
+        if output_dir:
+            result["result_file"] = _save_result(result, output_dir, verbose)
+
+        if verbose:
+            _print_summary(result)
+
+        return result
+
+    except Exception as e:
+        raise Exception(f"Perplexity API call failed: {e!s}")
+
+
+def web_search_stream(
+    query: str, output_dir: str | None = None, verbose: bool = False
+) -> Generator[str, None, dict]:
+    """
+    Streaming version of web_search: yields answer text as it arrives
+
+    The generator's return value is the same result dictionary web_search returns,
+    built once the stream ends (get it with ``result = yield from web_search_stream(...)``
+    or from ``StopIteration.value``).
+
+    Args:
+        query: Search query
+        output_dir: Output directory (optional, if provided will save results)
+        verbose: Whether to print detailed information
+
+    Yields:
+        str: Answer text deltas
+
+    Raises:
+        Same as web_search
+    """
+    api_key = _get_api_key()
+    client = _client(api_key)
+
+    try:
+        stream = client.chat.completions.create(
+            model="sonar", messages=_messages(query), stream=True
         )
 
-        # Extract response content
-        answer = completion.choices[0].message.content
-
-        # Build result dictionary
-        result = {
-            "timestamp": datetime.now().isoformat(),
-            "query": query,
-            "model": completion.model,
-            "answer": answer,
-            "response": {
-                "content": answer,
-                "role": completion.choices[0].message.role,
-                "finish_reason": completion.choices[0].finish_reason,
-            },
-            "usage": {
-                "prompt_tokens": completion.usage.prompt_tokens,
-                "completion_tokens": completion.usage.completion_tokens,
-                "total_tokens": completion.usage.total_tokens,
-                "cost": {
-                    "total_cost": completion.usage.cost.total_cost,
-                    "input_tokens_cost": completion.usage.cost.input_tokens_cost,
-                    "output_tokens_cost": completion.usage.cost.output_tokens_cost,
-                },
-            },
-            "citations": [],
-            "search_results": [],
-        }
-
-        # Extract citation links (improved: includes complete metadata)
-        if hasattr(completion, "citations") and completion.citations:
-            for i, citation_url in enumerate(completion.citations, 1):
-                citation_data = {
-                    "id": i,
-                    "reference": f"[{i}]",
-                    "url": citation_url,
-                    "title": "",
-                    "snippet": "",
-                }
-
-                # Try to match from search_results
-                for search_item in result.get("search_results", []):
-                    if search_item.get("url") == citation_url:
-                        citation_data["title"] = search_item.get("title", "")
-                        citation_data["snippet"] = search_item.get("snippet", "")
-                        break
-
-                result["citations"].append(citation_data)
-
-        # Extract search result details
-        if hasattr(completion, "search_results") and completion.search_results:
-            for search_item in completion.search_results:
-                search_result = {
-                    "title": search_item.title,
-                    "url": search_item.url,
-                    "date": search_item.date,
-                    "last_updated": search_item.last_updated,
-                    "snippet": search_item.snippet,
-                    "source": search_item.source,
-                }
-                result["search_results"].append(search_result)
+        parts = []
+        model = None
+        role = "assistant"
+        finish_reason = None
+        usage = None
+        citations = None
+        search_results = None
+        for chunk in stream:
+            # Metadata may arrive on any chunk; usage and sources come with the last ones
+            model = chunk.model or model
+            usage = chunk.usage or usage
+            citations = chunk.citations or citations
+            search_results = chunk.search_results or search_results
+            if not chunk.choices:
+                continue
+            choice = chunk.choices[0]
+            finish_reason = choice.finish_reason or finish_reason
+            if choice.delta.role:
+                role = choice.delta.role
+            delta = choice.delta.content
+            if delta:
+                parts.append(delta)
+                yield delta
+
+        # Fold the stream into a completion-shaped object for the shared result builder
+        completion = SimpleNamespace(
+            model=model,
+            choices=[
+                SimpleNamespace(
+                    message=SimpleNamespace(content="".join(parts), role=role),
+                    finish_reason=finish_reason,
+                )
+            ],
+            usage=usage,
+            citations=citations,
+            search_results=search_results,
+        )
+        result = _build_result(query, completion)
 
-        # If output directory provided, save results
-        result_file = None
         if output_dir:
-            os.makedirs(output_dir, exist_ok=True)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_filename = f"search_{timestamp}.json"
-            output_path = os.path.join(output_dir, output_filename)
+            result["result_file"] = _save_result(result, output_dir, verbose)
+
+        if verbose:
+            _print_summary(result)
 
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(result, f, ensure_ascii=False, indent=2)
+        return result
+
+    except Exception as e:
+        raise Exception(f"Perplexity API call failed: {e!s}")
 
-            result_file = output_path
 
-            if verbose:
-                print(f"Search results saved to: {output_path}")
+async def _web_search_with(
+    client, query: str, output_dir: str | None, verbose: bool, limit: asyncio.Semaphore | None
+) -> dict:
+    """Run one search on an AsyncPerplexity client, optionally bounded by a semaphore"""
+    try:
+        async with limit or contextlib.nullcontext():
+            completion = await client.chat.completions.create(
+                model="sonar", messages=_messages(query)
+            )
+        result = _build_result(query, completion)
 
-        # Add file path to result
-        if result_file:
-            result["result_file"] = result_file
+        if output_dir:
+            result["result_file"] = await asyncio.to_thread(
+                _save_result, result, output_dir, verbose
+            )
 
         if verbose:
-            print(f"Query: {query}")
-            print(f"Answer: {answer[:200]}..." if len(answer) > 200 else answer)
+            _print_summary(result)
 
         return result
 
@@ -157,6 +319,65 @@ def web_search(query: str, output_dir: str | None = None, verbose: bool = False)
         raise Exception(f"Perplexity API call failed: {e!s}")
 
 
+async def web_search_async(
+    query: str, output_dir: str | None = None, verbose: bool = False
+) -> dict:
+    """
+    Async version of web_search, using the Perplexity async client
+
+    Args and return value are the same as web_search.
+    """
+    api_key = _get_api_key()
+    async with _perplexity().AsyncPerplexity(api_key=api_key) as client:
+        return await _web_search_with(client, query, output_dir, verbose, None)
+
+
+async def web_search_many(
+    queries: list[str],
+    output_dir: str | None = None,
+    verbose: bool = False,
+    max_concurrency: int = MAX_CONCURRENT_SEARCHES,
+) -> list[dict]:
+    """
+    Run several searches concurrently over one async client
+
+    Args:
+        queries: Search queries
+        output_dir: Output directory (optional, if provided will save each result)
+        verbose: Whether to print detailed information
+        max_concurrency: Maximum number of requests in flight at once
+
+    Returns:
+        list[dict]: One web_search result per query, in the order of queries
+
+    Raises:
+        Same as web_search; on the first failure the remaining queries are cancelled
+        and the failing query's exception is raised
+    """
+    api_key = _get_api_key()
+    if not queries:
+        return []
+
+    limit = asyncio.Semaphore(max_concurrency)
+    async with _perplexity().AsyncPerplexity(api_key=api_key) as client:
+        tasks = [
+            asyncio.create_task(_web_search_with(client, q, output_dir, verbose, limit))
+            for q in queries
+        ]
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            # Every task must be finished before the shared client is closed
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    for task in tasks:
+        if not task.cancelled() and task.exception() is not None:
+            raise task.exception()
+    return [task.result() for task in tasks]
+
+
 if __name__ == "__main__":
     import sys
 
@@ -1,59 +1,92 @@
 import os
 from pathlib import Path
+import tempfile
 from threading import Lock
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
 import yaml
 
+try:
+    from yaml import CSafeDumper, CSafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as CSafeDumper
+    from yaml import SafeLoader as CSafeLoader
+
+
+def _freeze(value: Any) -> Any:
+    """Read-only copy of parsed YAML: dicts become MappingProxyType views, lists become tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Mutable copy of a frozen config: mappings become dicts, tuples become lists"""
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
 
 class ConfigManager:
     """
     Thread-safe manager for reading and writing configuration files.
     Primarily manages config/main.yaml and reads .env.
-    """
-
-    _instance = None
-    _lock = Lock()
 
-    def __new__(cls):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super(ConfigManager, cls).__new__(cls)
-                    cls._instance._initialized = False
-        return cls._instance
+    Use the shared module-level ``config_manager`` instance.
+    """
 
     def __init__(self):
-        if self._initialized:
-            return
-
+        self._lock = Lock()
         self.project_root = Path(__file__).parent.parent.parent
         self.config_path = self.project_root / "config" / "main.yaml"
         self._config_cache = None
+        # Deeply read-only copy of _config_cache handed to callers
+        self._config_view: Mapping[str, Any] = MappingProxyType({})
         self._last_mtime = 0
-        self._initialized = True
+        self._last_size = -1
+        # Parsed .env, keyed by (mtime_ns, size) of the file
+        self._env_cache: Dict[str, str] = {}
+        self._env_key: tuple[int, int] | None = None
 
-    def load_config(self, force_reload: bool = False) -> Dict[str, Any]:
+    def load_config(self, force_reload: bool = False) -> Mapping[str, Any]:
         """
         Load configuration from main.yaml.
         Uses caching based on file modification time.
+
+        Returns the cached config, read-only at every level (nested dicts are
+        MappingProxyType views and lists are tuples); use load_config_copy()
+        to get a dict you can modify.
         """
         if not self.config_path.exists():
-            return {}
+            return MappingProxyType({})
 
-        current_mtime = self.config_path.stat().st_mtime
+        stat = self.config_path.stat()
+        current_mtime = stat.st_mtime
+        # Size catches rewrites that land within the filesystem's mtime resolution
+        unchanged = current_mtime == self._last_mtime and stat.st_size == self._last_size
 
-        if self._config_cache is None or force_reload or current_mtime > self._last_mtime:
+        if self._config_cache is None or force_reload or not unchanged:
             with self._lock:
                 try:
                     with open(self.config_path, "r", encoding="utf-8") as f:
-                        self._config_cache = yaml.safe_load(f) or {}
+                        self._config_cache = yaml.load(f, Loader=CSafeLoader) or {}
+                    self._config_view = _freeze(self._config_cache)
                     self._last_mtime = current_mtime
+                    self._last_size = stat.st_size
                 except Exception as e:
                     print(f"Error loading config: {e}")
-                    return {}
+                    return MappingProxyType({})
+
+        return self._config_view
 
-        return self._config_cache.copy()  # Return copy to prevent direct mutation
+    def load_config_copy(self, force_reload: bool = False) -> Dict[str, Any]:
+        """Load configuration from main.yaml as a private, mutable deep copy."""
+        return _thaw(self.load_config(force_reload))
 
     def save_config(self, config: Dict[str, Any]) -> bool:
         """
@@ -63,7 +96,8 @@ class ConfigManager:
         """
         try:
             # First, load current to ensure we have latest structure
-            current_config = self.load_config(force_reload=True)
+            # (re-parsed only if main.yaml changed on disk since it was cached)
+            current_config = self.load_config_copy()
 
             # recursive update strategy could be implemented here if granular updates are needed,
             # but for now we expect the caller to provide structurally correct data or we just save what's given.
@@ -80,22 +114,41 @@ class ConfigManager:
 
             deep_update(current_config, config)
 
+            # Serialize before taking the lock
+            data = yaml.dump(
+                current_config,
+                Dumper=CSafeDumper,
+                default_flow_style=False,
+                allow_unicode=True,
+                sort_keys=False,
+            )
+
             # Ensure directory exists
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
 
+            # Write to a temp file in the same directory, then atomically replace main.yaml,
+            # so readers never see a partially written file
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.config_path.parent, prefix=".main.", suffix=".yaml.tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(data)
+                if self.config_path.exists():
+                    # mkstemp creates the file as 0600; keep main.yaml's permissions
+                    os.chmod(tmp_path, self.config_path.stat().st_mode & 0o777)
+                stat = os.stat(tmp_path)
+                os.replace(tmp_path, self.config_path)
+            except BaseException:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+
+            # Update cache
             with self._lock:
-                with open(self.config_path, "w", encoding="utf-8") as f:
-                    yaml.safe_dump(
-                        current_config,
-                        f,
-                        default_flow_style=False,
-                        allow_unicode=True,
-                        sort_keys=False,
-                    )
-
-                # Update cache
                 self._config_cache = current_config
-                self._last_mtime = self.config_path.stat().st_mtime
+                self._config_view = _freeze(current_config)
+                self._last_mtime = stat.st_mtime
+                self._last_size = stat.st_size
 
             return True
         except Exception as e:
@@ -110,21 +163,7 @@ class ConfigManager:
         # but usually os.environ is populated at startup.
         # For dynamic .env reading, we might want to read the file directly.
 
-        env_vars = {}
-        env_path = self.project_root / ".env"
-
-        if env_path.exists():
-            try:
-                with open(env_path, "r", encoding="utf-8") as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line or line.startswith("#"):
-                            continue
-                        if "=" in line:
-                            key, val = line.split("=", 1)
-                            env_vars[key.strip()] = val.strip().strip('"').strip("'")
-            except Exception:
-                pass
+        env_vars = self._read_env_file()
 
         # Fallback to os.environ for values not in .env file but set in environment
         # Specific keys we care about
@@ -135,3 +174,41 @@ class ConfigManager:
             "model": env_vars.get("LLM_MODEL", os.environ.get("LLM_MODEL", "Pro/Flash")),
             # Add other non-sensitive info if needed
         }
+
+    def _read_env_file(self) -> Dict[str, str]:
+        """Parse .env into a dict, re-reading the file only when it changes."""
+        env_path = self.project_root / ".env"
+        try:
+            stat = env_path.stat()
+        except OSError:
+            return {}
+
+        key = (stat.st_mtime_ns, stat.st_size)
+        if key == self._env_key:
+            return self._env_cache
+
+        env_vars = {}
+        try:
+            # One read + splitlines instead of per-line file iteration
+            for raw in env_path.read_text(encoding="utf-8").splitlines():
+                line = raw.strip()
+                if not line or line[0] == "#":
+                    continue
+                name, sep, val = line.partition("=")
+                if not sep:
+                    continue
+                val = val.strip()
+                # Drop one pair of matching surrounding quotes
+                if len(val) >= 2 and val[0] == val[-1] and val[0] in "\"'":
+                    val = val[1:-1]
+                env_vars[name.strip()] = val
+        except Exception:
+            pass
+
+        self._env_cache = env_vars
+        self._env_key = key
+        return env_vars
+
+
+# Shared instance
+config_manager: ConfigManager = ConfigManager()
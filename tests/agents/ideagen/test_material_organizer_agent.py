@@ -0,0 +1,97 @@
+import asyncio
+import json
+import logging
+
+import pytest
+from tenacity import RetryError
+
+from src.agents.ideagen import base_idea_agent
+from src.agents.ideagen.base_idea_agent import BaseIdeaAgent
+from src.agents.ideagen.material_organizer_agent import MaterialOrganizerAgent
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    monkeypatch.setenv("LLM_MODEL", "test-model")
+    monkeypatch.setenv("LLM_BINDING_API_KEY", "test-key")
+    monkeypatch.setenv("LLM_BINDING_HOST", "https://llm.example/v1")
+    monkeypatch.setattr(BaseIdeaAgent, "_shared_logger", logging.getLogger("test_ideagen"))
+    return MaterialOrganizerAgent(language="en")
+
+
+def test_fallback_extract_degrades_on_retry_error(agent, monkeypatch):
+    async def failing_complete(**kwargs):
+        # What lightrag's tenacity-wrapped completion raises after its retries
+        raise RetryError(last_attempt=None)
+
+    monkeypatch.setattr(base_idea_agent, "get_openai_complete", lambda: failing_complete)
+
+    points = asyncio.run(agent._fallback_extract([{"title": "T", "user_query": "Q"}]))
+
+    assert [p["knowledge_point"] for p in points] == ["Comprehensive Research Topic"]
+
+
+def _records(n):
+    return [{"title": f"T{i}", "user_query": f"Q{i}", "output": f"O{i}"} for i in range(n)]
+
+
+def _fake_llm(prompts, fail_on=None):
+    async def call_llm(user_prompt, system_prompt, response_format=None):
+        prompts.append(user_prompt)
+        if fail_on and fail_on in user_prompt:
+            raise RuntimeError("batch failed")
+        # Every batch reports a shared point plus one point per record it saw
+        points = [{"knowledge_point": "Shared Topic", "description": "Appears in every batch"}]
+        for line in user_prompt.splitlines():
+            if line.startswith("Title: "):
+                title = line.removeprefix("Title: ")
+                points.append({"knowledge_point": title, "description": f"Point for {title}"})
+        return json.dumps({"knowledge_points": points})
+
+    return call_llm
+
+
+def test_process_splits_batches_and_dedupes(agent, monkeypatch):
+    prompts = []
+    monkeypatch.setattr(agent, "call_llm", _fake_llm(prompts))
+
+    points = asyncio.run(agent.process(_records(5), batch_size=2))
+
+    assert len(prompts) == 3
+    names = [p["knowledge_point"] for p in points]
+    assert names == ["Shared Topic", "T0", "T1", "T2", "T3", "T4"]
+
+
+def test_process_keeps_other_batches_when_one_fails(agent, monkeypatch):
+    prompts = []
+    monkeypatch.setattr(agent, "call_llm", _fake_llm(prompts, fail_on="Title: T2"))
+
+    points = asyncio.run(agent.process(_records(4), batch_size=2))
+
+    assert len(prompts) == 2
+    assert [p["knowledge_point"] for p in points] == ["Shared Topic", "T0", "T1"]
+
+
+def test_process_clamps_non_positive_batch_size(agent, monkeypatch):
+    prompts = []
+    monkeypatch.setattr(agent, "call_llm", _fake_llm(prompts))
+
+    points = asyncio.run(agent.process(_records(2), batch_size=0))
+
+    assert len(prompts) == 2
+    assert [p["knowledge_point"] for p in points] == ["Shared Topic", "T0", "T1"]
+
+
+def test_process_accepts_nan_in_llm_json(agent, monkeypatch):
+    async def call_llm(user_prompt, system_prompt, response_format=None):
+        # orjson rejects NaN literals; the shared loader must fall back to json
+        return (
+            '{"knowledge_points": [{"knowledge_point": "T0", '
+            '"description": "Point for T0", "score": NaN}]}'
+        )
+
+    monkeypatch.setattr(agent, "call_llm", call_llm)
+
+    points = asyncio.run(agent.process(_records(1), batch_size=1))
+
+    assert [p["knowledge_point"] for p in points] == ["T0"]
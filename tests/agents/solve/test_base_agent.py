@@ -0,0 +1,29 @@
+import asyncio
+
+from src.agents.solve import base_agent
+
+
+def test_encoding_is_resolved_once_per_model(monkeypatch):
+    calls = []
+
+    def resolve(model):
+        calls.append(model)
+        return None
+
+    monkeypatch.setattr(base_agent, "_encodings", {})
+    monkeypatch.setattr(base_agent, "_resolve_encoding", resolve)
+
+    async def main():
+        return [await base_agent._get_encoding("test-model") for _ in range(3)]
+
+    assert asyncio.run(main()) == [None, None, None]
+    assert calls == ["test-model"]
+
+
+def test_estimate_tokens_falls_back_to_character_count():
+    class BrokenEncoding:
+        def encode(self, text):
+            raise ValueError("disallowed special token")
+
+    assert base_agent._estimate_tokens("x" * 40, None) == 10
+    assert base_agent._estimate_tokens("x" * 40, BrokenEncoding()) == 10
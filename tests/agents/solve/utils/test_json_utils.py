@@ -1,3 +1,5 @@
+import math
+
 import pytest
 from src.agents.solve.utils.json_utils import extract_json_from_text
 
@@ -26,6 +28,49 @@ def foo():
     assert "def foo" in parsed["tool_calls"][0]["query"]
 
 
+def test_extract_json_ignores_braces_in_trailing_prose():
+    raw = 'Here is the plan: {"step": "use {x} and \\"}\\"", "n": 1} Hope this {helps}.'
+
+    parsed = extract_json_from_text(raw)
+
+    assert parsed == {"step": 'use {x} and "}"', "n": 1}
+
+
+def test_extract_json_prefers_array_when_it_starts_first():
+    raw = 'Result: [{"a": 1}, {"b": 2}] -- done'
+
+    parsed = extract_json_from_text(raw)
+
+    assert parsed == [{"a": 1}, {"b": 2}]
+
+
+def test_extract_json_pure_json_with_leading_whitespace():
+    raw = '\n  {"knowledge_points": [{"knowledge_point": "A", "description": "B"}]}\n'
+
+    parsed = extract_json_from_text(raw)
+
+    assert parsed == {"knowledge_points": [{"knowledge_point": "A", "description": "B"}]}
+
+
+def test_extract_json_accepts_nan_and_infinity():
+    raw = '{"score": NaN, "max": Infinity, "x": 1}'
+
+    parsed = extract_json_from_text(raw)
+
+    assert parsed is not None
+    assert math.isnan(parsed["score"])
+    assert parsed["max"] == math.inf
+    assert parsed["x"] == 1
+
+
+def test_extract_json_keeps_big_ints_exact():
+    raw = '{"id": 123456789012345678901234567890, "small": 7}'
+
+    parsed = extract_json_from_text(raw)
+
+    assert parsed == {"id": 123456789012345678901234567890, "small": 7}
+    assert isinstance(parsed["id"], int)
+
 
 # How to run the test
 # From repo root:
@@ -36,4 +81,4 @@ def foo():
 # pytest tests/agents/solve/utils/test_json_utils.py
 
 # Expected output
-# 1 passed
+# 6 passed
@@ -0,0 +1,98 @@
+import os
+import pickle
+
+import pytest
+
+from src.agents.solve.utils import prompt_loader
+from src.agents.solve.utils.prompt_loader import PromptLoader
+
+
+@pytest.fixture
+def sidecar_dir(tmp_path, monkeypatch):
+    path = tmp_path / "sidecars"
+    monkeypatch.setattr(prompt_loader, "_SIDECAR_DIR", path)
+    return path
+
+
+@pytest.fixture
+def prompts_dir(tmp_path, sidecar_dir):
+    lang_dir = tmp_path / "prompts" / "en"
+    lang_dir.mkdir(parents=True)
+    for name in ("a", "b", "c"):
+        _write_prompt(lang_dir / f"{name}.yaml", f"System {name}")
+    return tmp_path / "prompts"
+
+
+def _write_prompt(path, system, mtime_ns=None):
+    path.write_text(f"system: {system}\nuser_template: Hello {{name}}\n", encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def _loader(prompts_dir):
+    return PromptLoader(base_dir=str(prompts_dir), language="en")
+
+
+def _tamper_sidecar(sidecar_dir, system):
+    """Rewrite the only sidecar so prompts served from it are recognisable"""
+    (sidecar_path,) = sidecar_dir.glob("*.pkl")
+    with open(sidecar_path, "rb") as f:
+        file_key, prompts = pickle.load(f)
+    with open(sidecar_path, "wb") as f:
+        pickle.dump((file_key, {**prompts, "system": system}), f)
+
+
+def test_load_rebuilds_after_file_edit(prompts_dir):
+    loader = _loader(prompts_dir)
+    prompt_file = prompts_dir / "en" / "a.yaml"
+    assert loader.load("a")["system"] == "System a"
+
+    # Bump the mtime explicitly so the edit is visible on coarse-grained filesystems
+    _write_prompt(prompt_file, "Edited a", mtime_ns=prompt_file.stat().st_mtime_ns + 10**9)
+
+    assert loader.load("a")["system"] == "Edited a"
+    assert len(loader._cache) == 1
+
+
+def test_cache_evicts_least_recently_used(prompts_dir):
+    loader = _loader(prompts_dir)
+    loader._cache_max = 2
+
+    loader.load("a")
+    loader.load("b")
+    loader.load("a")
+    loader.load("c")
+
+    cached = {os.path.basename(key[0]) for key in loader._cache}
+    assert cached == {"a.yaml", "c.yaml"}
+
+
+def test_sidecar_is_reused_across_loaders(prompts_dir, sidecar_dir):
+    _loader(prompts_dir).load("a")
+    _tamper_sidecar(sidecar_dir, "From sidecar")
+
+    assert _loader(prompts_dir).load("a")["system"] == "From sidecar"
+
+
+def test_sidecar_ignored_when_directory_not_owned(prompts_dir, sidecar_dir, monkeypatch):
+    _loader(prompts_dir).load("a")
+    _tamper_sidecar(sidecar_dir, "From sidecar")
+
+    owner = sidecar_dir.stat().st_uid
+    monkeypatch.setattr(prompt_loader.os, "getuid", lambda: owner + 1)
+
+    assert _loader(prompts_dir).load("a")["system"] == "System a"
+
+
+def test_new_version_replaces_stale_sidecar(prompts_dir, sidecar_dir):
+    prompt_file = prompts_dir / "en" / "a.yaml"
+    _loader(prompts_dir).load("a")
+
+    _write_prompt(prompt_file, "Edited a", mtime_ns=prompt_file.stat().st_mtime_ns + 10**9)
+    assert _loader(prompts_dir).load("a")["system"] == "Edited a"
+
+    (sidecar_path,) = sidecar_dir.glob("*.pkl")
+    with open(sidecar_path, "rb") as f:
+        file_key, prompts = pickle.load(f)
+    assert file_key == PromptLoader._file_key(prompt_file)
+    assert prompts["system"] == "Edited a"
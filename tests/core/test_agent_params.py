@@ -0,0 +1,33 @@
+import os
+
+from src.core import core
+from src.core.core import get_agent_params
+
+
+def _write_agents_yaml(root, temperature, mtime_ns):
+    config_path = root / "config" / "agents.yaml"
+    config_path.parent.mkdir(exist_ok=True)
+    config_path.write_text(f"solve:\n  temperature: {temperature}\n  max_tokens: 2048\n")
+    os.utime(config_path, ns=(mtime_ns, mtime_ns))
+
+
+def test_get_agent_params_picks_up_edits(tmp_path, monkeypatch):
+    monkeypatch.setattr(core, "PROJECT_ROOT", tmp_path)
+
+    _write_agents_yaml(tmp_path, 0.1, 1_000_000_000)
+    assert get_agent_params("solve") == {"temperature": 0.1, "max_tokens": 2048}
+
+    _write_agents_yaml(tmp_path, 0.9, 2_000_000_000)
+    assert get_agent_params("solve") == {"temperature": 0.9, "max_tokens": 2048}
+
+
+def test_get_agent_params_returns_a_copy(tmp_path, monkeypatch):
+    monkeypatch.setattr(core, "PROJECT_ROOT", tmp_path)
+    _write_agents_yaml(tmp_path, 0.2, 3_000_000_000)
+
+    params = get_agent_params("solve")
+    params["temperature"] = 5.0
+
+    assert get_agent_params("solve")["temperature"] == 0.2
+    # Unknown modules fall back to defaults
+    assert get_agent_params("missing") == {"temperature": 0.5, "max_tokens": 4096}
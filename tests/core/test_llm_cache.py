@@ -0,0 +1,30 @@
+from src.core import llm_cache
+from src.core.llm_cache import llm_cache_get, llm_cache_key, llm_cache_put
+
+
+def _key(user_prompt="hi", base_url="https://a.example/v1"):
+    return llm_cache_key("gpt-4o", base_url, "sys", user_prompt, 0.3, 1024, None)
+
+
+def test_llm_cache_hit_and_miss(monkeypatch):
+    monkeypatch.setattr(llm_cache, "_LLM_CACHE", {})
+
+    llm_cache_put(_key(), "hello")
+
+    assert llm_cache_get(_key()) == "hello"
+    assert llm_cache_get(_key(user_prompt="other")) is None
+    # Same model on another endpoint must not share answers
+    assert llm_cache_get(_key(base_url="https://b.example/v1")) is None
+
+
+def test_llm_cache_evicts_oldest_entry(monkeypatch):
+    monkeypatch.setattr(llm_cache, "_LLM_CACHE", {})
+    monkeypatch.setattr(llm_cache, "LLM_CACHE_MAX_ENTRIES", 2)
+
+    llm_cache_put(_key("a"), "A")
+    llm_cache_put(_key("b"), "B")
+    llm_cache_put(_key("c"), "C")
+
+    assert llm_cache_get(_key("a")) is None
+    assert llm_cache_get(_key("b")) == "B"
+    assert llm_cache_get(_key("c")) == "C"
@@ -0,0 +1,46 @@
+import asyncio
+import logging
+
+from src.core.llm_limits import LLM_MAX_CONCURRENCY, _parse_max_concurrency, llm_semaphore
+
+
+def test_llm_semaphore_is_shared_within_a_loop():
+    async def main():
+        return llm_semaphore(), llm_semaphore()
+
+    first, second = asyncio.run(main())
+
+    assert first is second
+    assert first._value == LLM_MAX_CONCURRENCY
+
+
+def test_llm_semaphore_works_across_separate_event_loops():
+    async def worker():
+        async with llm_semaphore():
+            await asyncio.sleep(0)
+
+    async def main():
+        # More workers than permits, so waiters bind the semaphore to this loop
+        await asyncio.gather(*(worker() for _ in range(LLM_MAX_CONCURRENCY + 4)))
+        return llm_semaphore()
+
+    first = asyncio.run(main())
+    second = asyncio.run(main())
+
+    assert first is not second
+
+
+def test_parse_max_concurrency_falls_back_on_invalid_value(caplog):
+    with caplog.at_level(logging.WARNING, logger="src.core.llm_limits"):
+        assert _parse_max_concurrency("lots") == 16
+    assert "LLM_MAX_CONCURRENCY" in caplog.text
+
+    assert _parse_max_concurrency(None) == 16
+    assert _parse_max_concurrency(" 4 ") == 4
+
+
+def test_parse_max_concurrency_clamps_to_at_least_one(caplog):
+    with caplog.at_level(logging.WARNING, logger="src.core.llm_limits"):
+        assert _parse_max_concurrency("0") == 1
+        assert _parse_max_concurrency("-3") == 1
+    assert "below 1" in caplog.text
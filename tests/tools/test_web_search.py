@@ -0,0 +1,147 @@
+import asyncio
+import importlib
+from types import SimpleNamespace
+
+import pytest
+
+# src.tools re-exports the web_search function under the module's name
+ws = importlib.import_module("src.tools.web_search")
+
+
+def _search_item(url, title):
+    return SimpleNamespace(
+        title=title, url=url, date=None, last_updated=None, snippet=f"{title} snippet", source="web"
+    )
+
+
+def _usage():
+    cost = SimpleNamespace(total_cost=0.01, input_tokens_cost=0.004, output_tokens_cost=0.006)
+    return SimpleNamespace(prompt_tokens=3, completion_tokens=5, total_tokens=8, cost=cost)
+
+
+def _completion(citations, search_results, usage):
+    message = SimpleNamespace(content="answer", role="assistant")
+    return SimpleNamespace(
+        model="sonar",
+        choices=[SimpleNamespace(message=message, finish_reason="stop")],
+        usage=usage,
+        citations=citations,
+        search_results=search_results,
+    )
+
+
+def test_build_result_fills_citation_metadata_from_search_results():
+    completion = _completion(
+        citations=["https://b.example", "https://missing.example", "https://a.example"],
+        search_results=[
+            _search_item("https://a.example", "A"),
+            _search_item("https://b.example", "B"),
+            _search_item("https://a.example", "A duplicate"),
+        ],
+        usage=_usage(),
+    )
+
+    result = ws._build_result("q", completion)
+
+    assert [(c["id"], c["title"], c["snippet"]) for c in result["citations"]] == [
+        (1, "B", "B snippet"),
+        (2, "", ""),
+        (3, "A", "A snippet"),
+    ]
+    assert len(result["search_results"]) == 3
+    assert result["usage"]["total_tokens"] == 8
+
+
+def _chunk(content=None, usage=None, finish_reason=None):
+    delta = SimpleNamespace(role=None, content=content)
+    return SimpleNamespace(
+        model="sonar",
+        usage=usage,
+        citations=None,
+        search_results=None,
+        choices=[SimpleNamespace(delta=delta, finish_reason=finish_reason)],
+    )
+
+
+def test_web_search_stream_without_usage(monkeypatch):
+    chunks = [_chunk("Hel"), _chunk("lo"), _chunk(finish_reason="stop")]
+    client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=lambda **kwargs: iter(chunks)))
+    )
+    monkeypatch.setenv("PERPLEXITY_API_KEY", "test-key")
+    monkeypatch.setattr(ws, "_perplexity", lambda: object())
+    monkeypatch.setattr(ws, "_client", lambda api_key: client)
+
+    stream = ws.web_search_stream("q")
+    deltas = []
+    with pytest.raises(StopIteration) as stop:
+        while True:
+            deltas.append(next(stream))
+    result = stop.value.value
+
+    assert deltas == ["Hel", "lo"]
+    assert result["answer"] == "Hello"
+    assert result["response"]["finish_reason"] == "stop"
+    assert result["usage"]["total_tokens"] == 0
+    assert result["usage"]["cost"]["total_cost"] == 0.0
+
+
+class _FakeAsyncClient:
+    """AsyncPerplexity stand-in: "bad" fails at once, other queries are slow"""
+
+    instances = []
+
+    def __init__(self, api_key):
+        self.closed = False
+        self.used_after_close = False
+        self.finished = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+        _FakeAsyncClient.instances.append(self)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.closed = True
+
+    async def _create(self, model, messages):
+        query = messages[-1]["content"]
+        if query == "bad":
+            raise RuntimeError("boom")
+        await asyncio.sleep(0.05)
+        if self.closed:
+            self.used_after_close = True
+        self.finished.append(query)
+        return _completion([], [], _usage())
+
+
+def test_web_search_many_cancels_siblings_before_closing_client(monkeypatch):
+    monkeypatch.setenv("PERPLEXITY_API_KEY", "test-key")
+    monkeypatch.setattr(
+        ws, "_perplexity", lambda: SimpleNamespace(AsyncPerplexity=_FakeAsyncClient)
+    )
+    _FakeAsyncClient.instances.clear()
+
+    async def main():
+        with pytest.raises(Exception, match="boom"):
+            await ws.web_search_many(["slow-1", "bad", "slow-2"])
+        # Give any task still running on the client a chance to finish
+        await asyncio.sleep(0.1)
+
+    asyncio.run(main())
+
+    (client,) = _FakeAsyncClient.instances
+    assert client.closed
+    assert client.finished == []
+    assert not client.used_after_close
+
+
+def test_web_search_many_returns_results_in_query_order(monkeypatch):
+    monkeypatch.setenv("PERPLEXITY_API_KEY", "test-key")
+    monkeypatch.setattr(
+        ws, "_perplexity", lambda: SimpleNamespace(AsyncPerplexity=_FakeAsyncClient)
+    )
+
+    results = asyncio.run(ws.web_search_many(["q1", "q2", "q3"], max_concurrency=2))
+
+    assert [r["query"] for r in results] == ["q1", "q2", "q3"]
@@ -0,0 +1,98 @@
+import os
+
+import pytest
+
+from src.utils.config_manager import ConfigManager
+
+
+def _manager(root):
+    manager = ConfigManager()
+    manager.project_root = root
+    return manager
+
+
+def test_read_env_file_parses_lines(tmp_path):
+    (tmp_path / ".env").write_text(
+        "# comment\n"
+        "\n"
+        "LLM_MODEL=gpt-4o\n"
+        "  SPACED = value with spaces  \n"
+        "URL=https://host/v1?a=b&c=d\n"
+        'DOUBLE="quoted # not a comment"\n'
+        "SINGLE='single'\n"
+        'MISMATCHED="open\n'
+        'LONE="\n'
+        "no_equals_line\n"
+        "EMPTY=\n",
+        encoding="utf-8",
+    )
+
+    env = _manager(tmp_path)._read_env_file()
+
+    assert env == {
+        "LLM_MODEL": "gpt-4o",
+        "SPACED": "value with spaces",
+        "URL": "https://host/v1?a=b&c=d",
+        "DOUBLE": "quoted # not a comment",
+        "SINGLE": "single",
+        "MISMATCHED": '"open',
+        "LONE": '"',
+        "EMPTY": "",
+    }
+
+
+def test_read_env_file_reuses_cache_until_file_changes(tmp_path):
+    env_path = tmp_path / ".env"
+    env_path.write_text("A=1\n", encoding="utf-8")
+    os.utime(env_path, ns=(1_000_000_000, 1_000_000_000))
+    manager = _manager(tmp_path)
+
+    first = manager._read_env_file()
+    assert manager._read_env_file() is first
+
+    # Same size and mtime: the cached result is still returned
+    env_path.write_text("A=2\n", encoding="utf-8")
+    os.utime(env_path, ns=(1_000_000_000, 1_000_000_000))
+    assert manager._read_env_file() is first
+
+    os.utime(env_path, ns=(2_000_000_000, 2_000_000_000))
+    assert manager._read_env_file() == {"A": "2"}
+
+
+def test_read_env_file_missing(tmp_path):
+    assert _manager(tmp_path)._read_env_file() == {}
+
+
+def _manager_with_config(root, text):
+    manager = _manager(root)
+    manager.config_path = root / "main.yaml"
+    manager.config_path.write_text(text, encoding="utf-8")
+    return manager
+
+
+def test_load_config_is_read_only_at_every_level(tmp_path):
+    manager = _manager_with_config(
+        tmp_path, "system:\n  language: en\n  tags: [a, b]\n  nested: {deep: 1}\n"
+    )
+
+    config = manager.load_config()
+
+    with pytest.raises(TypeError):
+        config["system"]["language"] = "zh"
+    with pytest.raises(TypeError):
+        config["system"]["nested"]["deep"] = 2
+    with pytest.raises(AttributeError):
+        config["system"]["tags"].append("c")
+    assert manager.load_config()["system"]["language"] == "en"
+
+
+def test_load_config_copy_is_mutable_and_independent(tmp_path):
+    manager = _manager_with_config(tmp_path, "system:\n  language: en\n  tags: [a, b]\n")
+
+    config = manager.load_config_copy()
+    config["system"]["language"] = "zh"
+    config["system"]["tags"].append("c")
+
+    assert config["system"] == {"language": "zh", "tags": ["a", "b", "c"]}
+    assert manager.load_config()["system"]["language"] == "en"
+    assert manager.load_config()["system"]["tags"] == ("a", "b")